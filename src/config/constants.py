@@ -33,6 +33,9 @@ INITIAL_STORAGE_CAPACITY = 100      # how many items the player can store at the
 
 # UI CONSTANTS
 CHART_TIME_MARKER_UNIT = "Month"      # Units for vertical chart lines: "Day", "Week", "Month"
+TIME_FRAME_DAYS = {                   # Length of each depot time frame in days ("Total" has no limit)
+    "Daily": 1, "Weekly": 7, "Monthly": 30, "Yearly": 365, "Total": None,
+}
 
 # MAP AND SOUND CONSTANTS
 
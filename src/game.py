@@ -96,14 +96,15 @@ class Game:
             'button_slower_150': self.images['button_slower_150']
         }
 
-        # load image for info window background frame
-        self.pic_info_window: pygame.Surface = pygame.image.load(os.path.join(PICTURES_PATH, "info_window_frame.png"))
+        # load image for info window background frame (converted to the display format once,
+        # so the pop-up windows and their scaled copies blit without per-pixel conversion)
+        self.pic_info_window: pygame.Surface = pygame.image.load(os.path.join(PICTURES_PATH, "info_window_frame.png")).convert_alpha()
 
         # Load portraits for encountable characters and places
         self.pic_portraits: Dict[str, pygame.Surface] = {
-            "portrait_merchant": pygame.image.load(os.path.join(PICTURES_PATH, "portrait_merchant.png")),
-            "portrait_harbor": pygame.image.load(os.path.join(PICTURES_PATH, "portrait_harbor.png")),
-            "portrait_shop": pygame.image.load(os.path.join(PICTURES_PATH, "portrait_shop.png"))
+            "portrait_merchant": pygame.image.load(os.path.join(PICTURES_PATH, "portrait_merchant.png")).convert_alpha(),
+            "portrait_harbor": pygame.image.load(os.path.join(PICTURES_PATH, "portrait_harbor.png")).convert_alpha(),
+            "portrait_shop": pygame.image.load(os.path.join(PICTURES_PATH, "portrait_shop.png")).convert_alpha()
         }
         
         self.time_control: TimeControl = TimeControl(
@@ -153,11 +154,15 @@ class Game:
         Returns:
             Dict[str, Any]: A dictionary containing loaded surfaces and nested image dictionaries.
         """
+        def load(filename: str) -> pygame.Surface:
+            """Load a picture and convert it to the display format, so blits need no per-pixel conversion."""
+            return pygame.image.load(os.path.join(PICTURES_PATH, filename)).convert_alpha()
+        
         images = {'goods_30': {}}
         # Load bigger images for general stats
-        images['money_50'] = pygame.image.load(os.path.join(PICTURES_PATH, "money_50.png"))
-        images['stock_1024'] = pygame.image.load(os.path.join(PICTURES_PATH, "total_stock_full.png"))
-        images['warehouses_1024'] = pygame.image.load(os.path.join(PICTURES_PATH, "warehouses_full.png"))
+        images['money_50'] = load("money_50.png")
+        images['stock_1024'] = load("total_stock_full.png")
+        images['warehouses_1024'] = load("warehouses_full.png")
         
         # Downscale the 1024x1024 images to 30x30 for the top bar
         images['stock_30'] = pygame.transform.smoothscale(images['stock_1024'], (30, 30))
@@ -165,23 +170,24 @@ class Game:
 
         
         # Load buttons for time settings
-        images['button_start_stop_150'] = pygame.image.load(os.path.join(PICTURES_PATH, "button_start_stop_150.png"))
-        images['button_faster_150'] = pygame.image.load(os.path.join(PICTURES_PATH, "button_faster_150.png"))
-        images['button_slower_150'] = pygame.image.load(os.path.join(PICTURES_PATH, "button_slower_150.png"))
+        images['button_start_stop_150'] = load("button_start_stop_150.png")
+        images['button_faster_150'] = load("button_faster_150.png")
+        images['button_slower_150'] = load("button_slower_150.png")
 
         # Load the button for toggling the sound
-        images['button_sound_80'] = pygame.image.load(os.path.join(PICTURES_PATH, "button_sound_80.png"))
+        images['button_sound_80'] = load("button_sound_80.png")
         
         # Load all good icons
         for good in self.goods:
-            img_path = os.path.join(PICTURES_PATH, f"{good.name.lower()}_30.png")
-            images['goods_30'][good.name] = pygame.image.load(img_path)
+            images['goods_30'][good.name] = load(f"{good.name.lower()}_30.png")
+        
+        # Smaller good icons for the depot detail panel, scaled once here instead of while drawing
+        images['goods_24'] = {name: pygame.transform.scale(img, (24, 24)) for name, img in images['goods_30'].items()}
 
         # Load pictograms for the side menu
         pictogram_names = ["map", "market", "depot", "politics", "trade_routes", "building"]
         for name in pictogram_names:
-            img_path = os.path.join(PICTURES_PATH, f"pictogram_{name}_100.png")
-            images[f'pictogram_{name}'] = pygame.image.load(img_path)
+            images[f'pictogram_{name}'] = load(f"pictogram_{name}_100.png")
         
         return images
     
@@ -277,6 +283,7 @@ class Game:
                     self.depot.update_total_stock()
                     self.depot.update_stock_history()
                     self.depot.update_income_and_expenditures()
+                    self.depot.update_trade_statistics()
                     for good in self.goods:
                         good.update_price_history()  # Bookkeeping price history, actual prices recorded hourly
             
@@ -390,6 +397,7 @@ class Game:
                 
             for event in pygame.event.get():
                 if event.type == pygame.MOUSEMOTION:
+                    self.state.mouse_pos = event.pos
                     # Clear any hover states that aren't from the current frame
                     for good in self.goods:
                         if not hasattr(good, '_external_hover'):
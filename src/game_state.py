@@ -1,7 +1,7 @@
 import datetime
 import pygame
 from collections import namedtuple
-from typing import Dict, List, Optional, Any, Tuple, TYPE_CHECKING
+from typing import Callable, Dict, List, Optional, Any, Tuple, TYPE_CHECKING
 from .ui.helper_modules.warning_message import WarningMessage
 from .config.constants import START_DATE
 
@@ -105,7 +105,11 @@ class GameState:
         self.last_month: int = int(start_date_parts[1])
         self.last_year: int = int(start_date_parts[2])
         
-        self.depot_time_frame: str = "Daily"
+        # Callbacks notified when the depot time frame or the hour changes
+        self._time_frame_listeners: List[Callable[[], None]] = []
+        self._hour_listeners: List[Callable[[], None]] = []
+        
+        self._depot_time_frame: str = "Daily"
         self.depot_time_frames: List[str] = ["Daily", "Weekly", "Monthly", "Yearly", "Total"]
         
         # Money glow effect and button click animations
@@ -119,6 +123,9 @@ class GameState:
         self.depot_plus_buttons: Dict[str, Tuple[int, int, int, int]] = {}
         self.depot_plus_rects: Dict[str, pygame.Rect] = {}
         self.depot_buttons: Dict[str, pygame.Rect] = {}
+        self.depot_view_cache: Dict[str, Any] = {}    # Pre-rendered depot panel and the state it was rendered for
+        self.top_bar_cache: Dict[str, Any] = {}       # Pre-rendered top bar and the values it was rendered for
+        self.mouse_pos: Tuple[int, int] = (0, 0)      # Last mouse position, updated from MOUSEMOTION events
         
         # State for the depot chart view
         self.depot_active_chart: str = "Wealth"
@@ -129,6 +136,35 @@ class GameState:
         """Check if the map is currently being displayed on either side of the screen."""
         return self.left_side_mode == 'map' or self.right_side_mode == 'map'
         
+    @property
+    def depot_time_frame(self) -> str:
+        """The time frame of the depot statistics ("Daily" ... "Total")."""
+        return self._depot_time_frame
+    
+    @depot_time_frame.setter
+    def depot_time_frame(self, time_frame: str) -> None:
+        changed = time_frame != self._depot_time_frame
+        self._depot_time_frame = time_frame
+        if changed:
+            for callback in self._time_frame_listeners:
+                callback()
+    
+    def register_time_frame_listener(self, callback: Callable[[], None]) -> None:
+        """Register a callback that is called whenever the depot time frame changes.
+        
+        Args:
+            callback: Function without arguments.
+        """
+        self._time_frame_listeners.append(callback)
+    
+    def register_hour_listener(self, callback: Callable[[], None]) -> None:
+        """Register a callback that is called whenever a new hour starts (prices update hourly).
+        
+        Args:
+            callback: Function without arguments.
+        """
+        self._hour_listeners.append(callback)
+        
     def update_time(self) -> None:
         """Advance the game simulation time based on current speed level."""
         self.tick_counter += 1
@@ -177,6 +213,10 @@ class GameState:
         self.last_month = current_month
         self.last_year = current_year
         
+        if hour_changed:
+            for callback in self._hour_listeners:
+                callback()
+        
         if self.message_timer > 0:
             self.message_timer -= 1
             if self.message_timer == 0:
@@ -1,5 +1,6 @@
 import datetime
-from typing import Dict, List, Optional, Any, Union
+import heapq
+from typing import Callable, Dict, List, Optional, Any, Tuple, Union
 
 class Depot:
     """Manages the player's financial state, inventory, and trade history.
@@ -9,6 +10,10 @@ class Depot:
     property ownership and trade statistics.
     """
     
+    # Trade types as stored in trade_types
+    TRADE_PURCHASE = 0
+    TRADE_SALE = 1
+    
     def __init__(self, money: float, transaction_cost: float, storage_capacity: int) -> None:
         """Initialize the depot with starting values.
         
@@ -56,6 +61,11 @@ class Depot:
             good_name: [0] for good_name in self.good_stock
         }
         self.trades: List[Dict[str, Any]] = []                     # trade tracking for bookkeeping
+        # Trades as parallel lists for fast time frame queries
+        self.trade_types: List[int] = []                           # TRADE_PURCHASE or TRADE_SALE
+        self.trade_goods: List[str] = []
+        self.trade_quantities: List[int] = []
+        self.trade_totals: List[float] = []
         self.expenditure_history: List[float] = [0.0]              # expenditures tracking for bookkeeping
         self.income_history: List[float] = [0.0]                   # income tracking for bookkeeping
         self.transaction_expenditure_history: List[float] = [0.0]  # transaction expenditures tracking for bookkeeping
@@ -84,6 +94,22 @@ class Depot:
         # Add list to record individual trade cycles with their timestamp
         self.trade_cycle_records: List[Dict[str, Any]] = []
 
+        # Trade actions and trade cycle statistics of the current day, rolled into the
+        # histories once per day (same bookkeeping as income and expenditures)
+        self.buy_actions: int = 0
+        self.sell_actions: int = 0
+        self.cycle_stats: Dict[str, Any] = self._new_cycle_stats()
+        self.trade_action_history: List[Tuple[int, int]] = [(0, 0)]            # (buy actions, sell actions) per day
+        self.cycle_stats_history: List[Dict[str, Any]] = [self._new_cycle_stats()]  # trade cycle statistics per day
+        # Index of the first trade of every day in trade_action_history, followed by the first trade of today
+        self.trade_day_starts: List[int] = [0, 0]
+        
+        # Incremented whenever a trade is recorded or the day's bookkeeping advances,
+        # so views can tell whether their formatted statistics are still current
+        self.stats_version: int = 0
+        # Callbacks notified on the same occasions (see register_invalidation_listener)
+        self._invalidation_listeners: List[Callable[[], None]] = []
+
     def buy(self, good: Any, quantity_to_buy: int, game_state: Any) -> bool:
         """Buy a quantity of a good from market to depot.
         
@@ -203,6 +229,47 @@ class Depot:
             "total": price * quantity
         }
         self.trades.append(trade)
+        self.trade_types.append(self.TRADE_PURCHASE if is_purchase else self.TRADE_SALE)
+        self.trade_goods.append(trade["good"])
+        self.trade_quantities.append(quantity)
+        self.trade_totals.append(trade["total"])
+        self._stats_changed()
+        if is_purchase:
+            self.buy_actions += 1
+        else:
+            self.sell_actions += 1
+    
+    def register_invalidation_listener(self, callback: Callable[[], None]) -> None:
+        """Register a callback that is called whenever the depot statistics change.
+        
+        This happens when a trade is recorded and when the daily bookkeeping runs.
+        
+        Args:
+            callback: Function without arguments.
+        """
+        self._invalidation_listeners.append(callback)
+    
+    def _stats_changed(self) -> None:
+        """Advance stats_version and notify the registered invalidation listeners."""
+        self.stats_version += 1
+        for callback in self._invalidation_listeners:
+            callback()
+    
+    def trade_start_index(self, period_days: Optional[int]) -> int:
+        """Return the index of the first trade of the last period_days days, including today.
+        
+        Uses the same day boundaries as get_trade_action_counts, so the trades from this
+        index on are exactly the ones counted there.
+        
+        Args:
+            period_days: Number of days to include. If None, all history is included.
+            
+        Returns:
+            int: Index into the trade lists; equals the number of trades if none qualify.
+        """
+        if period_days is None or period_days > len(self.trade_day_starts):
+            return 0
+        return self.trade_day_starts[-period_days]
     
     def _record_trade_cycle(self, good_name: str, profit: float, quantity: int, buy_price: float, sell_price: float, timestamp: datetime.datetime) -> Dict[str, Any]:
         """Record statistics for a completed trade cycle and store an individual record.
@@ -249,6 +316,15 @@ class Depot:
         }
         
         self.trade_cycle_records.append(trade_cycle)
+        
+        # Update the statistics of the current day
+        self.cycle_stats["total"] += 1
+        self.cycle_stats["total_profit"] += profit
+        if profit > 0:
+            self.cycle_stats["successful"] += 1
+        profits = self.cycle_stats["by_good"].setdefault(good_name, [0.0, 0])
+        profits[0] += profit_per_unit
+        profits[1] += 1
         return trade_cycle
     
     def update_wealth(self, goods: List[Any]) -> float:
@@ -270,8 +346,25 @@ class Depot:
                     
         self.wealth.append(total_value)
         self.money_history.append(self.money)  # Record current money
+        self._stats_changed()
         return total_value
     
+    def wealth_start_for(self, period_days: Optional[int]) -> float:
+        """Return the wealth at the start of a period.
+        
+        For a period of n days this is the wealth recorded n entries ago, or the
+        first recorded wealth if the history is shorter than the period.
+        
+        Args:
+            period_days: Length of the period in days. If None, the whole history is used.
+            
+        Returns:
+            float: The start wealth of the period.
+        """
+        if period_days is not None and len(self.wealth) >= period_days:
+            return self.wealth[-period_days]
+        return self.wealth[0]
+    
     def update_income_and_expenditures(self) -> None:
         """Update the income and expenditures history for the current day and reset daily counters."""
         self.income_history.append(self.income)
@@ -280,6 +373,25 @@ class Depot:
         self.income = 0
         self.expenditures = 0
         self.transaction_expenditures = 0
+        self._stats_changed()
+    
+    def update_trade_statistics(self) -> None:
+        """Update the trade action and trade cycle history for the current day and reset daily counters."""
+        self.trade_action_history.append((self.buy_actions, self.sell_actions))
+        self.cycle_stats_history.append(self.cycle_stats)
+        self.trade_day_starts.append(len(self.trade_types))
+        self.buy_actions = 0
+        self.sell_actions = 0
+        self.cycle_stats = self._new_cycle_stats()
+        self._stats_changed()
+    
+    @staticmethod
+    def _new_cycle_stats() -> Dict[str, Any]:
+        """Return empty trade cycle statistics for a single day.
+        
+        "by_good" maps a good name to [sum of profit per unit, number of cycles].
+        """
+        return {"total": 0, "successful": 0, "total_profit": 0, "by_good": {}}
     
     def update_total_stock(self) -> int:
         """Update the total stock count history.
@@ -301,49 +413,73 @@ class Depot:
         for good_name, quantity in self.good_stock.items():
             self.stock_history[good_name].append(quantity)
     
-    def get_trade_cycle_stats(self, current_date: datetime.datetime, time_delta: Optional[datetime.timedelta]) -> Dict[str, Any]:
-        """Return summarized trade cycle statistics filtered by an optional time_delta.
-           
+    def get_trade_action_counts(self, period_days: Optional[int]) -> Tuple[int, int]:
+        """Return the number of buy and sell actions of the last period_days days, including today.
+        
+        Args:
+            period_days: Number of days to include. If None, all history is included.
+            
+        Returns:
+            Tuple[int, int]: Buy actions and sell actions.
+        """
+        buy_actions = self.buy_actions
+        sell_actions = self.sell_actions
+        if period_days is None:
+            history = self.trade_action_history
+        elif period_days > 1:
+            history = self.trade_action_history[-(period_days - 1):]
+        else:
+            history = []
+        for buys, sells in history:
+            buy_actions += buys
+            sell_actions += sells
+        return buy_actions, sell_actions
+    
+    def get_period_trade_cycle_stats(self, period_days: Optional[int]) -> Dict[str, Any]:
+        """Return summarized trade cycle statistics of the last period_days days, including today.
+        
+        Works on the daily statistics, so the cost does not grow with the number of trades.
+        
         Args:
-            current_date: The reference date for filtering.
-            time_delta: The duration to look back. If None, all history is included.
+            period_days: Number of days to include. If None, all history is included.
             
         Returns:
-            Dict[str, Any]: Summarized statistics including total cycles, success rate, and best/worst goods.
+            Dict[str, Any]: Summarized statistics with the keys "total_cycles", "successful_cycles",
+            "success_rate" (percent), "total_profit", and "best_goods" / "worst_goods", each a list
+            of up to three (good name, average profit per unit) pairs, best or worst first.
         """
-        if time_delta is not None:
-            start_date = current_date - time_delta
-            records = [r for r in self.trade_cycle_records if r["timestamp"] >= start_date]
+        if period_days is None:
+            days = self.cycle_stats_history + [self.cycle_stats]
+        elif period_days > 1:
+            days = self.cycle_stats_history[-(period_days - 1):] + [self.cycle_stats]
         else:
-            records = self.trade_cycle_records[:]
-        
-        total_cycles = len(records)
-        successful_cycles = sum(1 for r in records if r["profit"] > 0)
-        total_profit = sum(r["profit"] for r in records)
-        
-        # Group profit per unit by good for aggregation
-        by_good = {}
-        for r in records:
-            name = r["good"]
-            by_good.setdefault(name, []).append(r["profit_per_unit"])
-        best_goods = sorted(
-            [(name, sum(profits)/len(profits)) for name, profits in by_good.items()],
-            key=lambda x: x[1],
-            reverse=True
-        )
-        worst_goods = sorted(
-            [(name, sum(profits)/len(profits)) for name, profits in by_good.items()],
-            key=lambda x: x[1]
-        )
-        stats = {
+            days = [self.cycle_stats]
+        
+        total_cycles = 0
+        successful_cycles = 0
+        total_profit = 0
+        by_good: Dict[str, List[float]] = {}
+        for day in days:
+            total_cycles += day["total"]
+            successful_cycles += day["successful"]
+            total_profit += day["total_profit"]
+            for name, (profit_sum, count) in day["by_good"].items():
+                profits = by_good.setdefault(name, [0.0, 0])
+                profits[0] += profit_sum
+                profits[1] += count
+        
+        avg_profits = [(name, profit_sum / count) for name, (profit_sum, count) in by_good.items()]
+        # Only the top and bottom three goods are shown
+        best_goods = heapq.nlargest(3, avg_profits, key=lambda x: x[1])
+        worst_goods = heapq.nsmallest(3, avg_profits, key=lambda x: x[1])
+        return {
             "total_cycles": total_cycles,
             "successful_cycles": successful_cycles,
             "success_rate": (successful_cycles/total_cycles*100) if total_cycles > 0 else 0,
             "total_profit": total_profit,
-            "best_goods": best_goods[:3], 
-            "worst_goods": worst_goods[:3]
+            "best_goods": best_goods,
+            "worst_goods": worst_goods
         }
-        return stats
     
     def book_cost_of_living(self, cost_of_living: float) -> None:
         """Book the cost of living for the current day.
@@ -353,3 +489,4 @@ class Depot:
         """
         self.money -= cost_of_living
         self.expenditures += cost_of_living
+        self._stats_changed()
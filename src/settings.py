@@ -2,6 +2,7 @@ import pygame
 from typing import List, Tuple, Optional, Any, TYPE_CHECKING
 from .config.colors import LIGHT_GRAY, DARK_GRAY, BLACK, WHITE, RED, GREEN, BLUE, YELLOW, ORANGE, PURPLE, PINK
 from .ui.helper_modules.color_wheel import ColorWheel
+from .ui.helper_modules.overlay import get_overlay, get_window_frame
 
 if TYPE_CHECKING:
     from .game import Game
@@ -41,6 +42,8 @@ class SettingsWindow:
         self.height: int = 300
         self.window_rect: pygame.Rect = pygame.Rect(0, 0, self.width, self.height)
         self.window_rect.center = (screen.get_width()//2, screen.get_height()//2)
+        self.overlay: pygame.Surface = get_overlay(screen.get_size())  # shared, alpha set per draw
+        self.scaled_frame: Optional[pygame.Surface] = get_window_frame(game, (self.width, self.height)) if game else None
         
         # Create three buttons at the bottom with modified label for reset
         self.buttons: List[Tuple[pygame.Rect, str]] = []
@@ -85,15 +88,12 @@ class SettingsWindow:
     def draw(self) -> None:
         """Draw the settings window and all its components."""
         # Draw semi-transparent overlay
-        overlay = pygame.Surface((self.screen.get_width(), self.screen.get_height()))
-        overlay.set_alpha(128)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0,0))
+        self.overlay.set_alpha(128)
+        self.screen.blit(self.overlay, (0, 0))
         
         # Draw background (using game frame image if available)
-        if self.game and hasattr(self.game, 'pic_info_window'):
-            scaled_frame = pygame.transform.scale(self.game.pic_info_window, (self.width, self.height))
-            self.screen.blit(scaled_frame, self.window_rect)
+        if self.scaled_frame is not None:
+            self.screen.blit(self.scaled_frame, self.window_rect)
         else:
             pygame.draw.rect(self.screen, LIGHT_GRAY, self.window_rect)
             pygame.draw.rect(self.screen, DARK_GRAY, self.window_rect, 2)
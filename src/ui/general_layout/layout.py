@@ -1,6 +1,6 @@
 import pygame
 import datetime
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ...models.good import Good
@@ -9,6 +9,7 @@ if TYPE_CHECKING:
 
 from ...config.colors import *
 from ..helper_modules.dropdown import Dropdown
+from ..helper_modules.text_cache import render_text, text_width
 from ...config.constants import SCREEN_WIDTH, SCREEN_HEIGHT, SIDEBAR_WIDTH
 
 def draw_layout(
@@ -36,6 +37,53 @@ def _draw_background(screen: pygame.Surface) -> None:
 
     screen.fill(BEIGE)
 
+# Goods shown in the two rows of the top bar inventory
+_UPPER_GOODS = ("Wood", "Wool", "Wheat", "Hide", "Beer", "Meat")
+_LOWER_GOODS = ("Stone", "Iron", "Fish", "Wine", "Linen", "Pottery")
+_GOODS_START_X = 360
+_GOODS_SPACING = 160
+
+# Top bar background with borders, separators and all icons, keyed by id of the images dict
+_TOP_BAR_CACHE: Dict[int, pygame.Surface] = {}
+
+def _get_top_bar_chrome(images: Dict[str, Any]) -> pygame.Surface:
+    """Return the static part of the top bar: background, borders, separators and icons.
+    
+    Only the texts change from frame to frame, so everything else is drawn once.
+    
+    Args:
+        images: Dictionary of pre-loaded images.
+        
+    Returns:
+        pygame.Surface: The cached top bar surface (SCREEN_WIDTH x 60).
+    """
+    key = id(images)
+    chrome = _TOP_BAR_CACHE.get(key)
+    if chrome is None:
+        goods_images_30 = images['goods_30']
+        chrome = pygame.Surface((SCREEN_WIDTH, 60))
+        top_bar = chrome.get_rect()
+        pygame.draw.rect(chrome, LIGHT_GRAY, top_bar)
+        pygame.draw.rect(chrome, DARK_GRAY, top_bar, 2)
+        
+        chrome.blit(images['money_50'], (10, 5))
+        
+        # Separator bars
+        pygame.draw.line(chrome, DARK_GRAY, (306, 5), (306, 55), 2)
+        pygame.draw.line(chrome, DARK_GRAY, (1310, 5), (1310, 55), 2)
+        
+        # Goods icons left of their stock texts
+        for i, good_name in enumerate(_UPPER_GOODS):
+            chrome.blit(goods_images_30[good_name], (_GOODS_START_X + (i * _GOODS_SPACING) - 35, 0))
+        for i, good_name in enumerate(_LOWER_GOODS):
+            chrome.blit(goods_images_30[good_name], (_GOODS_START_X + (i * _GOODS_SPACING) - 35, 29))
+        
+        # Warehouses and Total Stock icons
+        chrome.blit(images['warehouses_30'], (1330, 5))
+        chrome.blit(images['stock_30'], (1330, 30))
+        _TOP_BAR_CACHE[key] = chrome
+    return chrome
+
 def _draw_top_bar(
     screen: pygame.Surface,
     main_depot: "Depot",
@@ -46,59 +94,121 @@ def _draw_top_bar(
 ) -> None:
     """Draws the top bar with money, date, goods inventory, warehouses, and stock."""
 
-    money_50 = images['money_50']
-    goods_images_30 = images['goods_30']
-    stock_30 = images['stock_30']
-    warehouses_30 = images['warehouses_30']
-    
-    top_bar = pygame.Rect(0, 0, SCREEN_WIDTH, 60)
-    pygame.draw.rect(screen, LIGHT_GRAY, top_bar)
-    pygame.draw.rect(screen, DARK_GRAY, top_bar, 2)
-    
     # Money display with glow effect if active
     money_color = game_state.money_effect_color if hasattr(game_state, "money_effect_color") and game_state.money_effect_color else BLACK
-    money_text = main_font.render(f"Money: {round(main_depot.money, 2)}", True, money_color)
-    screen.blit(money_text, (70, 10))
-    screen.blit(money_50, (10, 5))
     
-    # Date display
-    date_text = main_font.render(date.strftime("%d.%m.%Y | %H o'clock"), True, DARK_BROWN)
-    screen.blit(date_text, (70, 35))
+    # Only re-render the bar when one of the shown values has changed
+    cache = game_state.top_bar_cache
+    key = (id(images), id(main_font), main_depot.money, money_color, date.date(), date.hour,
+           tuple(main_depot.good_stock.values()), main_depot.warehouse_count)
+    if cache.get("key") != key:
+        cache["surface"] = _render_top_bar(main_depot, main_font, date, images, money_color)
+        cache["key"] = key
+    screen.blit(cache["surface"], (0, 0))
 
-    # Separator bar
-    pygame.draw.line(screen, DARK_GRAY, (306, 5), (306, 55), 2)
+def _render_top_bar(
+    main_depot: "Depot",
+    main_font: pygame.font.Font,
+    date: datetime.datetime,
+    images: Dict[str, Any],
+    money_color: Tuple[int, int, int]
+) -> pygame.Surface:
+    """Render the top bar texts onto a copy of the pre-drawn background and icons.
     
-    # Goods inventory display
-    start_x = 360
-    spacing = 160
+    Args:
+        main_depot: The player's depot providing money and stock.
+        main_font: Font for the texts.
+        date: Current game date.
+        images: Dictionary of pre-loaded images.
+        money_color: Color of the money text (changes during the glow effect).
+        
+    Returns:
+        pygame.Surface: The complete top bar (SCREEN_WIDTH x 60).
+    """
+    surface = _get_top_bar_chrome(images).copy()
+    good_stock = main_depot.good_stock
     
-    # Upper row goods
-    upper_goods = ["Wood", "Wool", "Wheat", "Hide", "Beer", "Meat"]
-    for i, good_name in enumerate(upper_goods):
-        text = main_font.render(f"{good_name}: {round(main_depot.good_stock[good_name], 2)}", True, BLACK)
-        screen.blit(text, (start_x + (i * spacing), 10))
-        screen.blit(goods_images_30[good_name], (start_x + (i * spacing) - 35, 0))
+    texts = [
+        (render_text(main_font, f"Money: {round(main_depot.money, 2)}", money_color), (70, 10)),
+        # Date display
+        (render_text(main_font, date.strftime("%d.%m.%Y | %H o'clock"), DARK_BROWN), (70, 35)),
+    ]
     
-    # Lower row goods
-    lower_goods = ["Stone", "Iron", "Fish", "Wine", "Linen", "Pottery"]
-    for i, good_name in enumerate(lower_goods):
-        text = main_font.render(f"{good_name}: {round(main_depot.good_stock[good_name], 2)}", True, BLACK)
-        screen.blit(text, (start_x + (i * spacing), 35))
-        screen.blit(goods_images_30[good_name], (start_x + (i * spacing) - 35, 29))
-
-    # Separator bar
-    pygame.draw.line(screen, DARK_GRAY, (1310, 5), (1310, 55), 2)
+    # Goods inventory display, upper and lower row
+    for i, good_name in enumerate(_UPPER_GOODS):
+        texts.append((render_text(main_font, f"{good_name}: {round(good_stock[good_name], 2)}", BLACK),
+                      (_GOODS_START_X + (i * _GOODS_SPACING), 10)))
+    for i, good_name in enumerate(_LOWER_GOODS):
+        texts.append((render_text(main_font, f"{good_name}: {round(good_stock[good_name], 2)}", BLACK),
+                      (_GOODS_START_X + (i * _GOODS_SPACING), 35)))
     
     # Warehouses counter
-    screen.blit(warehouses_30, (1330, 5))
-    warehouses_text = main_font.render(f"Warehouses: {main_depot.warehouse_count}", True, BLACK)
-    screen.blit(warehouses_text, (1365, 10))
+    texts.append((render_text(main_font, f"Warehouses: {main_depot.warehouse_count}", BLACK), (1365, 10)))
     
     # Total Stock counter
-    screen.blit(stock_30, (1330, 30))
-    total_stock = sum(main_depot.good_stock.values())
-    stock_text = main_font.render(f"Total Stock: {total_stock}", True, BLACK)
-    screen.blit(stock_text, (1365, 35))
+    total_stock = sum(good_stock.values())
+    texts.append((render_text(main_font, f"Total Stock: {total_stock}", BLACK), (1365, 35)))
+    surface.blits(texts, doreturn=False)
+    return surface
+
+def _build_trade_sections() -> Tuple[Tuple[Any, ...], ...]:
+    """Build the fixed layout of the three trading sections in the bottom bar.
+    
+    Returns:
+        Tuple[Tuple[Any, ...], ...]: Per section (name, x_start, good/quantity/buy/sell/dropdown keys,
+        good/quantity/buy/sell rects, buy and sell button labels, dropdown triangle points).
+    """
+    sections = []
+    for section, x_start, buy_fkey, sell_fkey in (('one', 20, "F1", "F2"),
+                                                  ('two', 390, "F3", "F4"),
+                                                  ('three', 760, "F5", "F6")):
+        good_rect = pygame.Rect(x_start, SCREEN_HEIGHT - 56, 150, 25)
+        sections.append((
+            section, x_start,
+            f'good_{section}', f'quantity_{section}', f'buy_{section}', f'sell_{section}', f'dropdown_{section}',
+            good_rect,
+            pygame.Rect(x_start, SCREEN_HEIGHT - 29, 150, 25),
+            pygame.Rect(x_start + 170, SCREEN_HEIGHT - 45, 80, 30),
+            pygame.Rect(x_start + 270, SCREEN_HEIGHT - 45, 80, 30),
+            f"Buy ({buy_fkey})", f"Sell ({sell_fkey})",
+            # Small triangle indicating the good dropdown
+            ((good_rect.right - 20, good_rect.centery - 5),
+             (good_rect.right - 10, good_rect.centery - 5),
+             (good_rect.right - 15, good_rect.centery + 5)),
+        ))
+    return tuple(sections)
+
+# Trading sections of the bottom bar; their positions only depend on the screen constants
+_TRADE_SECTIONS = _build_trade_sections()
+_BOTTOM_BAR_RECT = pygame.Rect(0, SCREEN_HEIGHT-60, SCREEN_WIDTH, 60)
+# Hoverable controls of all sections (good selector, buy and sell button), checked in one collidelist call
+_HOVER_RECTS = tuple(rect for section in _TRADE_SECTIONS for rect in (section[7], section[9], section[10]))
+
+# Filled and bordered bottom bar controls, keyed by (width, height, fill color, border color)
+_BUTTON_SURF_CACHE: Dict[Tuple[int, int, Tuple[int, int, int], Tuple[int, int, int]], pygame.Surface] = {}
+
+def _get_button_surface(rect: pygame.Rect, fill_color: Tuple[int, int, int], border_color: Tuple[int, int, int]) -> pygame.Surface:
+    """Return a pre-drawn control background with a 2px border.
+    
+    One blit is cheaper than the fill and border draw calls it replaces. The bottom bar
+    controls have only a few sizes and hover colors, so the cache stays small.
+    
+    Args:
+        rect: The control rectangle (only its size is used).
+        fill_color: Background color.
+        border_color: Border color.
+        
+    Returns:
+        pygame.Surface: The cached control surface.
+    """
+    key = (rect.width, rect.height, fill_color, border_color)
+    surf = _BUTTON_SURF_CACHE.get(key)
+    if surf is None:
+        surf = pygame.Surface(rect.size).convert()
+        surf.fill(fill_color)
+        pygame.draw.rect(surf, border_color, surf.get_rect(), 2)
+        _BUTTON_SURF_CACHE[key] = surf
+    return surf
 
 def _draw_bottom_bar(
     screen: pygame.Surface,
@@ -112,19 +222,22 @@ def _draw_bottom_bar(
     
     Time controls and sound controls are drawn separately in their own modules.
     """
-    bottom_bar = pygame.Rect(0, SCREEN_HEIGHT-60, SCREEN_WIDTH, 60)
-    pygame.draw.rect(screen, LIGHT_GRAY, bottom_bar)
-    pygame.draw.rect(screen, DARK_GRAY, bottom_bar, 2)
+    pygame.draw.rect(screen, LIGHT_GRAY, _BOTTOM_BAR_RECT)
+    pygame.draw.rect(screen, DARK_GRAY, _BOTTOM_BAR_RECT, 2)
     
     buttons = {}
 
     # set the hovered property of all goods to False, the chart gets rendered later and will separately check if some of the chart internal buttons trigger a hover effect
     # for now we will check if the buy or sell buttons trigger a hover effect from this layout script
+    # The same pass builds a name lookup for the goods linked to hovered buy/sell buttons
+    goods_by_name: Dict[str, "Good"] = {}
     for good in goods:
         good.hovered = False
+        goods_by_name[good.name] = good
     
-    # Get mouse position for hover effects
-    mouse_pos = pygame.mouse.get_pos()
+    # Find the hovered control, if any; the controls do not overlap, so there is at most one
+    hover_idx = pygame.Rect(pygame.mouse.get_pos(), (1, 1)).collidelist(_HOVER_RECTS)
+    hovered_rect = _HOVER_RECTS[hover_idx] if hover_idx != -1 else None
     
     def draw_input_field(rect: pygame.Rect, text: str, is_selected: bool) -> None:
         """Helper to draw a text input field with an optional cursor.
@@ -134,119 +247,93 @@ def _draw_bottom_bar(
             text: The current text content.
             is_selected: Whether this field is currently focused.
         """
-        pygame.draw.rect(screen, WHITE, rect)
-        pygame.draw.rect(screen, DARK_BROWN, rect, 2)
+        screen.blit(_get_button_surface(rect, WHITE, DARK_BROWN), rect)
         
         # Only draw the cursor if field is selected
         if is_selected and game_state.cursor_visible:
-            # Calculate cursor position based on text width up to cursor
+            # Calculate cursor position based on text width up to cursor (measured once per prefix)
             prefix = "Quantity: " + text[:game_state.cursor_position]
-            text_width = main_font.size(prefix)[0]
-            cursor_x = rect.x + text_width + 7
+            cursor_x = rect.x + text_width(main_font, prefix) + 7
             pygame.draw.line(screen, BLACK,
                            (cursor_x+4, rect.y + 5),
                            (cursor_x+4, rect.y + rect.height - 5),
                            2)
     
-    # Helper function to check if mouse is hovering over a rect
-    def is_hovering(rect: pygame.Rect) -> bool:
-        """Check if the mouse is currently hovering over the given rect."""
-        return rect.collidepoint(mouse_pos)
-    
     # Draw input fields and buttons for all three trading sections
-    sections = [
-        ('one', 20, "F1", "F2"),
-        ('two', 390, "F3", "F4"),
-        ('three', 760, "F5", "F6")
-    ]
-    
-    for section, x_start, buy_key, sell_key in sections:
-        good_rect = pygame.Rect(x_start, SCREEN_HEIGHT - 56, 150, 25)
-        qty_rect = pygame.Rect(x_start, SCREEN_HEIGHT - 29, 150, 25)
-        buy_rect = pygame.Rect(x_start + 170, SCREEN_HEIGHT - 45, 80, 30)
-        sell_rect = pygame.Rect(x_start + 270, SCREEN_HEIGHT - 45, 80, 30)
-        
+    button_click_effects = game_state.button_click_effects
+    for (section, x_start, good_key, qty_key, buy_key, sell_key, dropdown_key,
+         good_rect, qty_rect, buy_rect, sell_rect, buy_label, sell_label, triangle_points) in _TRADE_SECTIONS:
         # Store button rectangles
-        buttons[f'good_{section}'] = good_rect
-        buttons[f'quantity_{section}'] = qty_rect
-        buttons[f'buy_{section}'] = buy_rect
-        buttons[f'sell_{section}'] = sell_rect
+        buttons[good_key] = good_rect
+        buttons[qty_key] = qty_rect
+        buttons[buy_key] = buy_rect
+        buttons[sell_key] = sell_rect
         
         # Create dropdown if it doesn't exist (but don't draw it)
-        if f'dropdown_{section}' not in game_state.dropdowns:
-            game_state.dropdowns[f'dropdown_{section}'] = Dropdown(
+        if dropdown_key not in game_state.dropdowns:
+            game_state.dropdowns[dropdown_key] = Dropdown(
                 x_start, SCREEN_HEIGHT - 56, 150, 25,
                 game_state.available_goods, main_font
             )
         
         # Draw input fields and buttons (but not dropdowns)
         # Apply hover effect to good selection dropdown buttons
-        good_bg_color = DROPDOWN_HOVER if is_hovering(good_rect) else WHITE
-        pygame.draw.rect(screen, good_bg_color, good_rect)
-        pygame.draw.rect(screen, DARK_BROWN, good_rect, 2)
+        good_hovered = hovered_rect is good_rect
+        good_bg_color = DROPDOWN_HOVER if good_hovered else WHITE
+        screen.blit(_get_button_surface(good_rect, good_bg_color, DARK_BROWN), good_rect)
         
-        draw_input_field(qty_rect, input_fields[f'quantity_{section}'],
-                        mouse_clicked_on == f'quantity_{section}')
+        draw_input_field(qty_rect, input_fields[qty_key],
+                        mouse_clicked_on == qty_key)
                         
         # Draw buy button 
-        if is_hovering(buy_rect):
+        if hovered_rect is buy_rect:
             # if hovered, change color of the button 
             buy_color = BUY_BUTTON_HOVER
             # also set the "hovered" property of the good that is linked to the button to True 
-            # find the right good object from the list of goods
-            good_name = input_fields[f'good_{section}']
-            good = next(good for good in goods if good.name == good_name)
-            good.hovered = True
+            # find the right good object by its name
+            goods_by_name[input_fields[good_key]].hovered = True
 
         else:
             buy_color = BUY_BUTTON
 
 
-        pygame.draw.rect(screen, buy_color, buy_rect)
-        pygame.draw.rect(screen, BUY_BUTTON_BORDER, buy_rect, 2)
+        screen.blit(_get_button_surface(buy_rect, buy_color, BUY_BUTTON_BORDER), buy_rect)
         
         # Draw sell button
-        if is_hovering(sell_rect):
+        if hovered_rect is sell_rect:
             # if hovered, change color of the button 
             sell_color = SELL_BUTTON_HOVER
             # also set the "hovered" property of the good that is linked to the button to True 
-            # find the right good object from the list of goods
-            good_name = input_fields[f'good_{section}']
-            good = next(good for good in goods if good.name == good_name)
-            good.hovered = True
+            # find the right good object by its name
+            goods_by_name[input_fields[good_key]].hovered = True
         else:
             sell_color = SELL_BUTTON
 
-        pygame.draw.rect(screen, sell_color, sell_rect)
-        pygame.draw.rect(screen, SELL_BUTTON_BORDER, sell_rect, 2)
+        screen.blit(_get_button_surface(sell_rect, sell_color, SELL_BUTTON_BORDER), sell_rect)
         
         # NEW: Draw click animation overlay on buy and sell buttons if active
-        effect = game_state.button_click_effects.get(f'buy_{section}', 0)
+        effect = button_click_effects.get(buy_key, 0)
         if effect:
             effect_surf = pygame.Surface((buy_rect.width, buy_rect.height), pygame.SRCALPHA)
             effect_surf.fill((0, 0, 0, 100))
             screen.blit(effect_surf, (buy_rect.x, buy_rect.y))
-        effect = game_state.button_click_effects.get(f'sell_{section}', 0)
+        effect = button_click_effects.get(sell_key, 0)
         if effect:
             effect_surf = pygame.Surface((sell_rect.width, sell_rect.height), pygame.SRCALPHA)
             effect_surf.fill((0, 0, 0, 100))
             screen.blit(effect_surf, (sell_rect.x, sell_rect.y))
         
         # Draw small triangle to indicate dropdown - make it darker on hover
-        triangle_color = DARK_GRAY if not is_hovering(good_rect) else BLACK
-        pygame.draw.polygon(screen, triangle_color, [
-            (good_rect.right - 20, good_rect.centery - 5),
-            (good_rect.right - 10, good_rect.centery - 5),
-            (good_rect.right - 15, good_rect.centery + 5)
-        ])
+        triangle_color = DARK_GRAY if not good_hovered else BLACK
+        pygame.draw.polygon(screen, triangle_color, triangle_points)
         
         # Draw text
-        good_text = main_font.render(f"Good: {input_fields[f'good_{section}']}", True, BLACK)
+        good_text = render_text(main_font, f"Good: {input_fields[good_key]}", BLACK)
         # Separate label from value for quantity
-        qty_label = main_font.render("Quantity: ", True, BLACK)
-        qty_value = main_font.render(input_fields[f'quantity_{section}'], True, BLACK)
-        buy_text = main_font.render(f"Buy ({buy_key})", True, BUTTON_TEXT)  # Changed text color for better contrast
-        sell_text = main_font.render(f"Sell ({sell_key})", True, BUTTON_TEXT)  # Changed text color for better contrast
+        qty_label = render_text(main_font, "Quantity: ", BLACK)
+        qty_value = render_text(main_font, input_fields[qty_key], BLACK)
+        buy_text = render_text(main_font, buy_label, BUTTON_TEXT)  # Changed text color for better contrast
+        sell_text = render_text(main_font, sell_label, BUTTON_TEXT)  # Changed text color for better contrast
         
         screen.blit(good_text, (good_rect.x + 10, good_rect.y + 5))
         # Draw quantity label and value
@@ -340,7 +427,7 @@ def draw_right_bar(screen: pygame.Surface, images: Dict[str, Any], buttons: Dict
 
     # Render tooltips last to ensure they are on top of everything
     for text, pos in tooltips:
-        tooltip_surf = main_font.render(text, True, BLACK)
+        tooltip_surf = render_text(main_font, text, BLACK)
         # Position tooltip to the left of the side bar
         tooltip_rect = tooltip_surf.get_rect(topright=(pos[0] - 20, pos[1] + 10))
         
@@ -1,10 +1,40 @@
 import pygame
-from typing import List, Optional, Tuple, Any, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, Any, TYPE_CHECKING
 from ...config.colors import *
+from .overlay import get_overlay, get_window_frame
 
 if TYPE_CHECKING:
     from ...game import Game
 
+# Button background and label colors, indexed by the hover state (False, True)
+_BUTTON_COLORS = (TAN, SANDY_BROWN)
+_BUTTON_TEXT_COLORS = (BLACK, WHITE)
+
+# Scaled portraits, keyed by (portrait key, width, height); the same portraits recur for every dialogue
+_PORTRAIT_CACHE: Dict[Tuple[str, int, int], pygame.Surface] = {}
+_PORTRAIT_CACHE_LIMIT = 32  # bounded in case the screen size changes
+
+def _get_scaled_portrait(picture: str, portrait: pygame.Surface, width: int, height: int) -> pygame.Surface:
+    """Return the portrait scaled to the given size, reusing an earlier scaled copy.
+    
+    Args:
+        picture: Key of the portrait in game.pic_portraits.
+        portrait: The original portrait image.
+        width: Target width in pixels.
+        height: Target height in pixels.
+        
+    Returns:
+        pygame.Surface: The scaled portrait (same pixel format as the loaded portrait).
+    """
+    key = (picture, width, height)
+    scaled = _PORTRAIT_CACHE.get(key)
+    if scaled is None:
+        if len(_PORTRAIT_CACHE) >= _PORTRAIT_CACHE_LIMIT:
+            _PORTRAIT_CACHE.clear()
+        scaled = pygame.transform.scale(portrait, (width, height))
+        _PORTRAIT_CACHE[key] = scaled
+    return scaled
+
 class Dialogue:
     """A UI component that provides a semi-transparent dialogue window with portraits and options.
     
@@ -34,15 +64,15 @@ class Dialogue:
         self.active: bool = True
         self.result: Optional[str] = None  # Will store the selected answer
 
-        # first stop all sounds that are still running
-        pygame.mixer.stop()
-        
-        # Play sound if specified
+        # Play sound if specified, after stopping all sounds that are still running
+        # (e.g. the narration of the previous dialogue); the mixer is left alone otherwise
         if sound and hasattr(game, 'play_sound'):
+            pygame.mixer.stop()
             game.play_sound(sound)
         
         # Calculate portrait dimensions (70% of screen height)
         screen_width, screen_height = screen.get_size()
+        self.overlay: pygame.Surface = get_overlay((screen_width, screen_height))  # shared, alpha set per draw
         portrait_height = int(screen_height * 0.7)
         
         # Get original portrait aspect ratio to maintain proportions
@@ -52,10 +82,9 @@ class Dialogue:
             aspect_ratio: float = orig_width / orig_height
             portrait_width: int = int(portrait_height * aspect_ratio)
             
-            # Scale the portrait preserving aspect ratio
-            self.portrait: Optional[pygame.Surface] = pygame.transform.scale(
-                original_portrait,
-                (portrait_width, portrait_height)
+            # Scale the portrait preserving aspect ratio (cached across dialogues)
+            self.portrait: Optional[pygame.Surface] = _get_scaled_portrait(
+                picture, original_portrait, portrait_width, portrait_height
             )
             
             # Position portrait in bottom left
@@ -81,8 +110,11 @@ class Dialogue:
             dialogue_height
         )
         
-        # Create buttons for answers
-        self.buttons: List[Tuple[pygame.Rect, str]] = []
+        # Window frame scaled to the dialogue rect (shared; copied when the window is composed)
+        self.scaled_frame: Optional[pygame.Surface] = get_window_frame(game, self.dialogue_rect.size)
+        
+        # Create buttons for answers; button_rects[i] belongs to answers[i]
+        self.button_rects: List[pygame.Rect] = []
         button_width: int = min(dialogue_width - 40, 200)
         button_height: int = 40
         spacing: int = 20
@@ -99,7 +131,7 @@ class Dialogue:
                     button_width,
                     button_height
                 )
-                self.buttons.append((button_rect, answer))
+                self.button_rects.append(button_rect)
         else:
             # Single answer centered
             button_rect = pygame.Rect(
@@ -108,7 +140,65 @@ class Dialogue:
                 button_width,
                 button_height
             )
-            self.buttons.append((button_rect, self.answers[0]))
+            self.button_rects.append(button_rect)
+        
+        # Text does not change while the dialogue is open, so render it once:
+        # NPC name, wrapped dialogue text and both label variants of every button
+        self.name_surface: pygame.Surface = self.font.render(self.npc_name, True, DARK_BROWN)
+        self.name_pos: Tuple[int, int] = (self.dialogue_rect.x + 60, self.dialogue_rect.y + 25)
+        self.text_blits: List[Tuple[pygame.Surface, Tuple[int, int]]] = self._layout_wrapped_text(
+            self.text,
+            pygame.Rect(
+                self.dialogue_rect.x + 20,
+                self.dialogue_rect.y + 70,
+                self.dialogue_rect.width - 40,
+                self.dialogue_rect.height - 150
+            )
+        )
+        # (surface, blit position) per hover state, centered on the button
+        self.button_labels: List[Tuple[Tuple[pygame.Surface, Tuple[int, int]], ...]] = []
+        for button_rect, text in zip(self.button_rects, self.answers):
+            labels = []
+            for color in _BUTTON_TEXT_COLORS:
+                label = self.font.render(text, True, color)
+                labels.append((label, label.get_rect(center=button_rect.center).topleft))
+            self.button_labels.append(tuple(labels))
+        
+        # Window frame, name, text and buttons in their normal state, composed once
+        self.window_surface: pygame.Surface = self._build_window_surface()
+    
+    def _build_window_surface(self) -> pygame.Surface:
+        """Compose the static part of the dialogue window into one surface.
+        
+        Everything except the hover highlight of a button stays the same while the
+        dialogue is open, so draw() only has to blit this surface and redraw the
+        hovered button on top.
+        
+        Returns:
+            pygame.Surface: The dialogue window, the size of dialogue_rect.
+        """
+        if self.scaled_frame is not None:
+            window = self.scaled_frame.copy()
+        else:
+            # Fallback to drawing a rectangle
+            window = pygame.Surface(self.dialogue_rect.size)
+            window.fill(LIGHT_GRAY)
+            pygame.draw.rect(window, DARK_GRAY, window.get_rect(), 2)
+        
+        # Positions were computed in screen coordinates
+        offset_x, offset_y = self.dialogue_rect.topleft
+        def local(pos: Tuple[int, int]) -> Tuple[int, int]:
+            return (pos[0] - offset_x, pos[1] - offset_y)
+        
+        window.blit(self.name_surface, local(self.name_pos))
+        window.blits([(surf, local(pos)) for surf, pos in self.text_blits], doreturn=False)
+        for button_rect, labels in zip(self.button_rects, self.button_labels):
+            local_rect = button_rect.move(-offset_x, -offset_y)
+            text_surface, text_pos = labels[False]
+            window.fill(_BUTTON_COLORS[False], local_rect)
+            pygame.draw.rect(window, DARK_BROWN, local_rect, 2)
+            window.blit(text_surface, local(text_pos))
+        return window
     
     def draw(self) -> None:
         """Draw the dialogue UI."""
@@ -116,74 +206,43 @@ class Dialogue:
             return
             
         # Draw semi-transparent background overlay
-        overlay = pygame.Surface((self.screen.get_width(), self.screen.get_height()))
-        overlay.set_alpha(160)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        self.overlay.set_alpha(160)
+        self.screen.blit(self.overlay, (0, 0))
         
         # Draw portrait if available
         if self.portrait:
             self.screen.blit(self.portrait, self.portrait_rect)
         
-        # Draw dialogue window with background image if available
-        if hasattr(self.game, 'pic_info_window'):
-            # Scale the image to fit the dialogue window
-            scaled_frame = pygame.transform.scale(
-                self.game.pic_info_window,
-                (self.dialogue_rect.width, self.dialogue_rect.height)
-            )
-            self.screen.blit(scaled_frame, self.dialogue_rect)
-        else:
-            # Fallback to drawing a rectangle
-            pygame.draw.rect(self.screen, LIGHT_GRAY, self.dialogue_rect)
-            pygame.draw.rect(self.screen, DARK_GRAY, self.dialogue_rect, 2)
-        
-        # Draw NPC name
-        name_text = self.font.render(self.npc_name, True, DARK_BROWN)
-        self.screen.blit(name_text, (self.dialogue_rect.x + 60, self.dialogue_rect.y + 25))
+        # Draw the pre-composed dialogue window (frame, name, text and buttons)
+        screen = self.screen
+        screen.blit(self.window_surface, self.dialogue_rect)
         
-        # Draw dialogue text (with word wrapping)
-        self._draw_wrapped_text(
-            self.text,
-            pygame.Rect(
-                self.dialogue_rect.x + 20,
-                self.dialogue_rect.y + 70,
-                self.dialogue_rect.width - 40,
-                self.dialogue_rect.height - 150
-            )
-        )
-        
-        # Get mouse position for hover effects
-        mouse_pos = pygame.mouse.get_pos()
-        
-        # Draw answer buttons with hover effects
-        for button_rect, text in self.buttons:
-            # Check for hover state
-            is_hovered = button_rect.collidepoint(mouse_pos)
-            button_color = SANDY_BROWN if is_hovered else TAN
-            text_color = WHITE if is_hovered else BLACK
-            
-            pygame.draw.rect(self.screen, button_color, button_rect)
-            pygame.draw.rect(self.screen, DARK_BROWN, button_rect, 2)
-            
-            text_surface = self.font.render(text, True, text_color)
-            text_rect = text_surface.get_rect(center=button_rect.center)
-            self.screen.blit(text_surface, text_rect)
+        # Only a hovered button differs from the composed window; redraw it on top
+        hovered = self._button_at(pygame.mouse.get_pos())
+        if hovered >= 0:
+            button_rect = self.button_rects[hovered]
+            text_surface, text_pos = self.button_labels[hovered][True]
+            screen.fill(_BUTTON_COLORS[True], button_rect)
+            pygame.draw.rect(screen, DARK_BROWN, button_rect, 2)
+            screen.blit(text_surface, text_pos)
     
-    def _draw_wrapped_text(self, text: str, rect: pygame.Rect) -> None:
-        """Draw text that automatically wraps within the given rectangle.
+    def _layout_wrapped_text(self, text: str, rect: pygame.Rect) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Render text that automatically wraps within the given rectangle.
         
         Ensures that text does not overlap decorated borders.
         
         Args:
             text: The text to render.
             rect: Target rectangle for text area.
+            
+        Returns:
+            List[Tuple[pygame.Surface, Tuple[int, int]]]: Rendered lines with their screen
+            positions, ready for screen.blits().
         """
         font = self.font
         font_height: int = font.size("Tg")[1]
         
         words: List[str] = text.split(' ')
-        space_width: int = font.size(' ')[0]
         
         # Define margins to account for decorative borders
         x_margin: float = 0.09 * rect.width    # 9% margin necessary for the width
@@ -199,24 +258,54 @@ class Dialogue:
         
         line_spacing: int = int(font_height * 0.2)  # Add 20% of font height as line spacing
         
+        # Measure candidate lines to break the text, then render each line once; the
+        # whole line is measured because kerning makes it differ from the sum of its words
+        left: int = x
+        lines: List[Tuple[str, int]] = []
+        line_words: List[str] = []
+        ellipsis_pos: Optional[Tuple[int, int]] = None
         for word in words:
-            word_surface = font.render(word, True, BLACK)
-            word_width, word_height = word_surface.get_size()
+            line_width, line_height = font.size(" ".join(line_words + [word]))
             
             # Check if we need to wrap to the next line
-            if x + word_width >= max_x:
-                x = rect.left + int(x_margin/2)  # Reset to left margin, not left edge
+            if line_width >= max_x - left:
+                if line_words:
+                    lines.append((" ".join(line_words), y))
+                    line_words = []
                 y += font_height + line_spacing
                 
             # Check if we've exceeded the height and need to stop
-            if y + word_height > max_y:
-                # Add ellipsis to indicate truncated text
-                ellipsis = font.render("...", True, BLACK)
-                self.screen.blit(ellipsis, (x, y))
+            if y + line_height > max_y:
+                # Add ellipsis after the last accepted word to indicate truncated text
+                if line_words:
+                    x = left + font.size(" ".join(line_words) + " ")[0]
+                else:
+                    x = left
+                ellipsis_pos = (x, y)
                 break
                 
-            self.screen.blit(word_surface, (x, y))
-            x += word_width + space_width
+            line_words.append(word)
+        if line_words:
+            lines.append((" ".join(line_words), y))
+        
+        blits: List[Tuple[pygame.Surface, Tuple[int, int]]] = [
+            (font.render(line, True, BLACK), (left, line_y)) for line, line_y in lines
+        ]
+        if ellipsis_pos is not None:
+            blits.append((font.render("...", True, BLACK), ellipsis_pos))
+        return blits
+    
+    def _button_at(self, pos: Tuple[int, int]) -> int:
+        """Return the index of the button under the given position.
+        
+        Args:
+            pos: Screen coordinates.
+            
+        Returns:
+            int: Index into button_rects and answers, or -1 if no button is hit.
+        """
+        # collidelist scans the rect list in C
+        return pygame.Rect(pos, (1, 1)).collidelist(self.button_rects)
     
     def handle_click(self, pos: Tuple[int, int]) -> Optional[str]:
         """Handle mouse clicks on dialogue options.
@@ -230,11 +319,11 @@ class Dialogue:
         if not self.active:
             return None
             
-        for button_rect, answer in self.buttons:
-            if button_rect.collidepoint(pos):
-                self.result = answer
-                self.active = False
-                return answer
+        index = self._button_at(pos)
+        if index >= 0:
+            self.result = self.answers[index]
+            self.active = False
+            return self.result
         
         return None
 
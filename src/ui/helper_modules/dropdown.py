@@ -13,6 +13,7 @@ class Dropdown:
         is_open: Boolean indicating if the dropdown is currently expanded.
         dropdown_height: Total height of the expanded dropdown list.
         dropdown_rect: The rectangular area covering the entire expanded list.
+        items: Rect and rendered label of every option.
     """
 
     def __init__(self, x: int, y: int, width: int, height: int, options: List[str], font: pygame.font.Font) -> None:
@@ -37,6 +38,13 @@ class Dropdown:
         # Position above the input field
         self.dropdown_rect: pygame.Rect = pygame.Rect(x, y - self.dropdown_height, width, self.dropdown_height)
         
+        # Option rects and labels never change, so build them once
+        self.items: List[Tuple[pygame.Rect, pygame.Surface]] = [
+            (pygame.Rect(x, self.dropdown_rect.y + (i * self.item_height), width, self.item_height),
+             self.font.render(option, True, BLACK))
+            for i, option in enumerate(options)
+        ]
+        
     def draw(self, screen: pygame.Surface) -> None:
         """Draw the dropdown if it is currently open.
         
@@ -49,22 +57,18 @@ class Dropdown:
 
             
             # Draw options
-            for i, option in enumerate(self.options):
-                item_rect = pygame.Rect(self.dropdown_rect.x, 
-                                      self.dropdown_rect.y + (i * self.item_height),
-                                      self.dropdown_rect.width,
-                                      self.item_height)
-                
+            mouse_pos = pygame.mouse.get_pos()
+            last = len(self.items) - 1
+            for i, (item_rect, text) in enumerate(self.items):
                 # Highlight on hover
-                if item_rect.collidepoint(pygame.mouse.get_pos()):
+                if item_rect.collidepoint(mouse_pos):
                     pygame.draw.rect(screen, LIGHT_GRAY, item_rect)
                 
                 # Draw option text
-                text = self.font.render(option, True, BLACK)
                 screen.blit(text, (item_rect.x + 5, item_rect.y + 2))
                 
                 # Draw separator line
-                if i < len(self.options) - 1:
+                if i < last:
                     pygame.draw.line(screen, DARK_GRAY, 
                                    (item_rect.left, item_rect.bottom),
                                    (item_rect.right, item_rect.bottom))
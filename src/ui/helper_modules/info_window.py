@@ -1,10 +1,16 @@
 import pygame
 from typing import List, Optional, Tuple, Any, TYPE_CHECKING
 from ...config.colors import *
+from .overlay import get_overlay, get_window_frame
+from .text_cache import render_text
 
 if TYPE_CHECKING:
     from ...game import Game
 
+# Button background and label colors, indexed by the hover state (False, True)
+_BUTTON_COLORS = (WHITE, LIGHT_GRAY)
+_BUTTON_TEXT_COLORS = (BLACK, WHITE)
+
 class InfoWindow:
     """A pop-up information window with customizable message and buttons.
     
@@ -41,6 +47,14 @@ class InfoWindow:
         
         # Create window in center of screen
         screen_center = (screen.get_width() // 2, screen.get_height() // 2)
+        self.overlay: pygame.Surface = get_overlay(screen.get_size())  # shared, alpha set per draw
+        
+        # Get reference to game for the frame image
+        if not game:
+            from ...game_state import GameState
+            # This is a fallback and might fail if GameState isn't initialized correctly
+            game = GameState().game  # type: ignore
+        self.scaled_frame: Optional[pygame.Surface] = get_window_frame(game, (width, height))
         self.window_rect: pygame.Rect = pygame.Rect(0, 0, width, height)
         self.window_rect.center = screen_center
         
@@ -60,50 +74,37 @@ class InfoWindow:
     def draw(self) -> None:
         """Draw the information window overlay and content."""
         # Draw semi-transparent background overlay
-        s = pygame.Surface((self.screen.get_width(), self.screen.get_height()))
-        s.set_alpha(128)
-        s.fill((0, 0, 0))
-        self.screen.blit(s, (0, 0))
-        
-        # Get reference to game for the image
-        if hasattr(self, 'game') and self.game:
-            game = self.game
-        else:
-            from ...game_state import GameState
-            # This is a fallback and might fail if GameState isn't initialized correctly
-            game = GameState().game  # type: ignore
+        self.overlay.set_alpha(128)
+        self.screen.blit(self.overlay, (0, 0))
         
         # Use the frame image instead of drawing a rectangle
-        if hasattr(game, 'pic_info_window'):
-            # Scale the frame image to fit the window size
-            scaled_frame = pygame.transform.scale(game.pic_info_window, 
-                                               (self.window_rect.width, self.window_rect.height))
-            self.screen.blit(scaled_frame, self.window_rect)
+        if self.scaled_frame is not None:
+            self.screen.blit(self.scaled_frame, self.window_rect)
         else:
             # Fallback to the original rectangle if image not available
             pygame.draw.rect(self.screen, LIGHT_GRAY, self.window_rect)
             pygame.draw.rect(self.screen, DARK_GRAY, self.window_rect, 2)
         
         # Draw message - adjusted positioning
-        text = self.font.render(self.message, True, BLACK)
+        text = render_text(self.font, self.message, BLACK)
         text_rect = text.get_rect(center=(self.window_rect.centerx, self.window_rect.top + 60))
         self.screen.blit(text, text_rect)
         
         # Get mouse position for hover effects
         mouse_pos = pygame.mouse.get_pos()
         
-        # Draw buttons with hover effects
+        # Draw buttons with hover effects; backgrounds use Surface.fill (direct SDL rect fill)
+        screen = self.screen
+        draw_rect = pygame.draw.rect
         for button_rect, text in self.buttons:
-            # Check if mouse is hovering over this button
+            # Check if mouse is hovering over this button; the text turns white on hover
             is_hovered = button_rect.collidepoint(mouse_pos)
-            button_color = LIGHT_GRAY if is_hovered else WHITE
-            text_color = WHITE if is_hovered else BLACK  # Change text color on hover
             
-            pygame.draw.rect(self.screen, button_color, button_rect)
-            pygame.draw.rect(self.screen, DARK_GRAY, button_rect, 2)
-            text_surface = self.font.render(text, True, text_color)
+            screen.fill(_BUTTON_COLORS[is_hovered], button_rect)
+            draw_rect(screen, DARK_GRAY, button_rect, 2)
+            text_surface = render_text(self.font, text, _BUTTON_TEXT_COLORS[is_hovered])
             text_rect = text_surface.get_rect(center=button_rect.center)
-            self.screen.blit(text_surface, text_rect)
+            screen.blit(text_surface, text_rect)
 
     def handle_click(self, pos: Tuple[int, int]) -> Optional[str]:
         """Check if any button was clicked.
@@ -0,0 +1,52 @@
+import pygame
+from typing import Any, Dict, Optional, Tuple
+
+# Surfaces shared by the pop-up windows (Dialogue, InfoWindow, WarningMessage, SettingsWindow)
+
+# Black full-screen overlays, keyed by screen size; the alpha is set per use
+_OVERLAY_CACHE: Dict[Tuple[int, int], pygame.Surface] = {}
+
+# The info window frame picture scaled to window sizes, keyed by (picture id, width, height)
+_FRAME_CACHE: Dict[Tuple[int, int, int], pygame.Surface] = {}
+
+def get_overlay(size: Tuple[int, int]) -> pygame.Surface:
+    """Return the black overlay surface for the given screen size.
+
+    The surface is shared by all pop-up windows and reused every frame, so it is
+    only allocated and filled once per screen size. Set its alpha before each blit.
+
+    Args:
+        size: Size of the screen the overlay covers.
+
+    Returns:
+        pygame.Surface: The cached overlay surface.
+    """
+    overlay = _OVERLAY_CACHE.get(size)
+    if overlay is None:
+        overlay = pygame.Surface(size)
+        overlay.fill((0, 0, 0))
+        _OVERLAY_CACHE[size] = overlay
+    return overlay
+
+def get_window_frame(game: Any, size: Tuple[int, int]) -> Optional[pygame.Surface]:
+    """Return the info window frame picture scaled to the given window size.
+
+    Pop-up windows of the same size share the scaled frame. Copy it before drawing
+    on it or changing its alpha.
+
+    Args:
+        game: The Game instance holding pic_info_window (may be None).
+        size: Size of the window.
+
+    Returns:
+        Optional[pygame.Surface]: The cached scaled frame, or None if there is no frame picture.
+    """
+    picture = getattr(game, "pic_info_window", None)
+    if picture is None:
+        return None
+    key = (id(picture), size[0], size[1])
+    frame = _FRAME_CACHE.get(key)
+    if frame is None:
+        frame = pygame.transform.scale(picture, size)
+        _FRAME_CACHE[key] = frame
+    return frame
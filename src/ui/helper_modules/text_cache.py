@@ -0,0 +1,89 @@
+import pygame
+from typing import Dict, List, Tuple
+
+# Rendered text surfaces shared across the UI, keyed by (text, color, font id)
+_TEXT_CACHE: Dict[Tuple[str, Tuple[int, int, int], int], pygame.Surface] = {}
+_TEXT_CACHE_LIMIT = 1024    # keep the cache bounded in case many different texts are shown
+
+# Rendered fixed texts (titles and labels), keyed by (text, color, font id).
+# These come from a small fixed set, so the cache is never cleared.
+_STATIC_TEXT_CACHE: Dict[Tuple[str, Tuple[int, int, int], int], pygame.Surface] = {}
+
+def render_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    """Render antialiased text, reusing the surface from an earlier call with the same arguments.
+
+    The returned surface is shared; do not draw on it or change its alpha.
+
+    Args:
+        font: Font used for rendering.
+        text: The text to render.
+        color: Text color.
+
+    Returns:
+        pygame.Surface: The rendered text surface.
+    """
+    key = (text, color, id(font))
+    surf = _TEXT_CACHE.get(key)
+    if surf is None:
+        if len(_TEXT_CACHE) >= _TEXT_CACHE_LIMIT:
+            _TEXT_CACHE.clear()
+        surf = font.render(text, True, color)
+        _TEXT_CACHE[key] = surf
+    return surf
+
+# Text widths as measured by font.size, keyed by (text, font id)
+_WIDTH_CACHE: Dict[Tuple[str, int], int] = {}
+
+def text_width(font: pygame.font.Font, text: str) -> int:
+    """Return the rendered width of text, reusing the measurement from an earlier call.
+
+    Args:
+        font: Font used for measuring.
+        text: The text to measure.
+
+    Returns:
+        int: Width of the text in pixels.
+    """
+    key = (text, id(font))
+    width = _WIDTH_CACHE.get(key)
+    if width is None:
+        if len(_WIDTH_CACHE) >= _TEXT_CACHE_LIMIT:
+            _WIDTH_CACHE.clear()
+        width = font.size(text)[0]
+        _WIDTH_CACHE[key] = width
+    return width
+
+def static_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    """Render a fixed text once and keep it, unaffected by the bounded render_text cache.
+
+    The returned surface is shared; do not draw on it or change its alpha.
+
+    Args:
+        font: Font used for rendering.
+        text: The text to render; must come from a fixed set (titles, labels).
+        color: Text color.
+
+    Returns:
+        pygame.Surface: The rendered (antialiased) text surface.
+    """
+    key = (text, color, id(font))
+    surf = _STATIC_TEXT_CACHE.get(key)
+    if surf is None:
+        surf = font.render(text, True, color)
+        _STATIC_TEXT_CACHE[key] = surf
+    return surf
+
+def blit_batch(surf: pygame.Surface, blit_seq: List[Tuple[pygame.Surface, Tuple[int, int]]]) -> None:
+    """Blit a sequence of (surface, position) pairs, e.g. rendered texts, in a single call.
+
+    Uses Surface.fblits where available (pygame-ce) and falls back to Surface.blits.
+
+    Args:
+        surf: Target surface.
+        blit_seq: List of (source surface, destination) pairs.
+    """
+    fblits = getattr(surf, "fblits", None)
+    if fblits is not None:
+        fblits(blit_seq)
+    else:
+        surf.blits(blit_seq, doreturn=False)
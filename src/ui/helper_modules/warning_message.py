@@ -1,6 +1,7 @@
 import pygame
-from typing import Optional, TYPE_CHECKING
+from typing import Optional, Tuple, TYPE_CHECKING
 from ...config.colors import LIGHT_GRAY, DARK_GRAY, BLACK
+from .overlay import get_overlay, get_window_frame
 
 if TYPE_CHECKING:
     from ...game import Game
@@ -16,6 +17,7 @@ class WarningMessage:
         fade_time: Duration of the fade-out effect in seconds.
         game: Optional reference to the Game instance for frame styling.
         window_rect: The rectangular area for the warning box.
+        scaled_frame: The info window frame scaled to window_rect, if available.
     """
 
     def __init__(self, screen: pygame.Surface, message: str, font: pygame.font.Font, game: Optional['Game'] = None) -> None:
@@ -32,12 +34,23 @@ class WarningMessage:
         height: int = msg_surface.get_height() + 60
         self.window_rect: pygame.Rect = pygame.Rect(0, 0, width, height)
         self.window_rect.center = (screen.get_width() // 2, screen.get_height() // 2)
+        self.overlay: pygame.Surface = get_overlay(screen.get_size())  # shared, alpha set per draw
         self.screen: pygame.Surface = screen
         self.message: str = message
         self.font: pygame.font.Font = font
+        self.text_surface: pygame.Surface = msg_surface  # rendered once, faded via its surface alpha
+        self.text_pos: Tuple[int, int] = msg_surface.get_rect(center=(self.window_rect.centerx, self.window_rect.top + 40)).topleft
         self.timer: float = 2.0  # Warning persists for 2 seconds (time-based)
         self.fade_time: float = 0.5  # Fade out during the last 0.5 seconds
         self.game: Optional['Game'] = game  # store game reference
+        
+        # Own copy of the scaled frame, since fading changes its surface alpha
+        shared_frame = get_window_frame(game, (width, height)) if game else None
+        self.scaled_frame: Optional[pygame.Surface] = shared_frame.copy() if shared_frame is not None else None
+        if self.scaled_frame is None:
+            # Fallback box, faded the same way
+            self.fallback_box: pygame.Surface = pygame.Surface((width, height))
+            self.fallback_box.fill(LIGHT_GRAY)
 
     def update(self, delta_time: float = 0.016) -> None:
         """Update the message timer.
@@ -50,36 +63,24 @@ class WarningMessage:
     def draw(self) -> None:
         """Draw the warning message with transparency and fade-out effect."""
         # Determine dynamic alpha: if timer is within fade-out period, alpha decreases gradually.
-        if self.timer < self.fade_time:
-            current_alpha_background = int(128 * (self.timer / self.fade_time))
-            current_alpha_box = int(255 * (self.timer / self.fade_time))
-        else:
-            current_alpha_background = 128
-            current_alpha_box = 255
+        fade = self.timer / self.fade_time if self.timer < self.fade_time else 1.0
+        current_alpha_background = int(128 * fade)
+        current_alpha_box = int(255 * fade)
 
         # Draw semi-transparent background overlay with dynamic alpha
-        overlay = pygame.Surface((self.screen.get_width(), self.screen.get_height()))
-        overlay.set_alpha(current_alpha_background)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        self.overlay.set_alpha(current_alpha_background)
+        self.screen.blit(self.overlay, (0, 0))
         
         # Use the info window background frame if available; apply fading to the frame as well.
-        if self.game and getattr(self.game, "pic_info_window", None):
-            scaled_frame = pygame.transform.scale(self.game.pic_info_window, (self.window_rect.width, self.window_rect.height))
-            frame_surface = scaled_frame.copy()
-            frame_surface.set_alpha(current_alpha_box)
-            self.screen.blit(frame_surface, self.window_rect)
+        if self.scaled_frame is not None:
+            self.scaled_frame.set_alpha(current_alpha_box)
+            self.screen.blit(self.scaled_frame, self.window_rect)
         else:
             # Fallback to drawing a rectangle with fading colors
-            temp_surface = pygame.Surface((self.window_rect.width, self.window_rect.height))
-            temp_surface.fill(LIGHT_GRAY)
-            temp_surface.set_alpha(current_alpha_box)
-            self.screen.blit(temp_surface, self.window_rect)
+            self.fallback_box.set_alpha(current_alpha_box)
+            self.screen.blit(self.fallback_box, self.window_rect)
             pygame.draw.rect(self.screen, DARK_GRAY, self.window_rect, 2)
             
         # Draw warning message text with the same fade effect
-        text = self.font.render(self.message, True, BLACK)
-        text_surface = text.copy()
-        text_surface.set_alpha(current_alpha_box)
-        text_rect = text.get_rect(center=(self.window_rect.centerx, self.window_rect.top + 40))
-        self.screen.blit(text_surface, text_rect)
\ No newline at end of file
+        self.text_surface.set_alpha(current_alpha_box)
+        self.screen.blit(self.text_surface, self.text_pos)
\ No newline at end of file
@@ -1,13 +1,58 @@
 import pygame
 import datetime
-from typing import TYPE_CHECKING, Tuple, Optional, Any
+from typing import TYPE_CHECKING, Dict, List, Tuple, Optional, Any
 from ...config.colors import *
-from ...config.constants import SCREEN_WIDTH, SCREEN_HEIGHT, MODULE_WIDTH, START_DATE
+from ...config.constants import SCREEN_WIDTH, SCREEN_HEIGHT, MODULE_WIDTH, START_DATE, TIME_FRAME_DAYS
+from ..helper_modules.text_cache import render_text, static_text, blit_batch
 
 if TYPE_CHECKING:
     from ...models.depot import Depot
     from ...game_state import GameState
 
+# Statistics that have a +/- button opening the detail panel
+_BUTTON_LABELS = frozenset({"Current Wealth", "Wealth Start", "Total Stock", "Buy Actions", "Sell Actions", "Total Actions"})
+
+# Rows followed by a separator line
+_SEPARATOR_LABELS = frozenset({"Total Stock", "Total Actions", "Total Trade Profit", "Total"})
+
+# Pre-drawn depot containers (background and borders), keyed by (width, height)
+_CHROME_CACHE: Dict[Tuple[int, int], pygame.Surface] = {}
+
+# Font for the time frame arrows, created on first use (SysFont lookups are expensive)
+_ARROW_FONT: Optional[pygame.font.Font] = None
+
+def _get_arrow_font() -> pygame.font.Font:
+    """Return the cached font used for the time frame arrow buttons."""
+    global _ARROW_FONT
+    if _ARROW_FONT is None:
+        _ARROW_FONT = pygame.font.SysFont("RomanAntique.ttf", 24)
+    return _ARROW_FONT
+
+def _get_chrome(width: int, height: int) -> pygame.Surface:
+    """Return the depot container (BEIGE background with TAN and DARK_BROWN borders) of the given size.
+    
+    Args:
+        width: Width of the container in pixels.
+        height: Height of the container in pixels.
+        
+    Returns:
+        pygame.Surface: The cached container surface. Copy it before drawing onto it.
+    """
+    key = (width, height)
+    chrome = _CHROME_CACHE.get(key)
+    if chrome is None:
+        chrome = pygame.Surface(key)
+        depot_rect = chrome.get_rect()
+        pygame.draw.rect(chrome, BEIGE, depot_rect)
+        pygame.draw.rect(chrome, TAN, depot_rect, 10)
+        pygame.draw.rect(chrome, DARK_BROWN, depot_rect, 2)
+        _CHROME_CACHE[key] = chrome
+    return chrome
+
+def _section_title(font: pygame.font.Font, text: str) -> pygame.Surface:
+    """Return the rendered section title, e.g. "Wealth Statistics"."""
+    return static_text(font, text, DARK_BROWN)
+
 def draw_depot_view(screen: pygame.Surface, font: pygame.font.Font, depot: 'Depot', game_state: 'GameState', rect: pygame.Rect) -> None:
     """Draw the depot view panel on the right side of the screen.
     
@@ -22,43 +67,67 @@ def draw_depot_view(screen: pygame.Surface, font: pygame.font.Font, depot: 'Depo
         rect: The rectangular area where the depot view should be drawn.
     """
     
-    # Use the passed rect for positioning and dimensions
-    width = rect.width
-    height = rect.height
-    x = rect.x
-    y = rect.y
-    
-    # Draw depot container
-    depot_rect = pygame.Rect(x, y, width, height)
-    pygame.draw.rect(screen, BEIGE, depot_rect)
-    pygame.draw.rect(screen, TAN, depot_rect, 10)
-    pygame.draw.rect(screen, DARK_BROWN, depot_rect, 2)
+    # Initialize detail panel if not already set
+    if game_state.detail_panel is None:
+        from .depot_view_detail import DepotViewDetail
+        game_state.detail_panel = DepotViewDetail(rect, game_state)
+        # Open "Current Wealth" by default
+        game_state.detail_panel.show_for_statistic("Current Wealth")
+    else:
+        # Update detail panel position in case the view moved
+        game_state.detail_panel.rect = pygame.Rect(rect.left + 435, rect.top + 60, 340, rect.height-80)
+    detail_panel = game_state.detail_panel
     
-    # Draw heading with time frame
-    current_day = game_state.date.strftime("%d.%m.%Y")
+    mouse_pos = game_state.mouse_pos
+    hovered_plus = None
+    for label, plus_rect in game_state.depot_plus_rects.items():
+        if plus_rect.collidepoint(mouse_pos):
+            hovered_plus = label
+            break
     
-    # Calculate start date based on time frame
-    if game_state.depot_time_frame == "Daily":
-        start_date = game_state.date.strftime("%d.%m.%Y")
-    elif game_state.depot_time_frame == "Weekly":
-        start_date = (game_state.date - datetime.timedelta(days=6)).strftime("%d.%m.%Y")
-    elif game_state.depot_time_frame == "Monthly":
-        start_date = (game_state.date - datetime.timedelta(days=29)).strftime("%d.%m.%Y")
-    elif game_state.depot_time_frame == "Yearly":
-        start_date = (game_state.date - datetime.timedelta(days=364)).strftime("%d.%m.%Y")
-    else:  # "Total"
-        start_date = START_DATE  # Game start date
+    # Only re-render the panel when something it shows has changed
+    cache = game_state.depot_view_cache
+    if cache.get("key") != _depot_view_key(depot, game_state, rect, hovered_plus):
+        cache["surface"], cache["title_rect"] = _render_depot_panel(font, depot, game_state, rect, hovered_plus)
+        # Rendering may clamp the scroll offset, so build the key afterwards
+        cache["key"] = _depot_view_key(depot, game_state, rect, hovered_plus)
+    screen.blit(cache["surface"], rect.topleft)
     
-    # Create heading text with date range
-    if game_state.depot_time_frame == "Total":
-        heading_text = f"{game_state.depot_time_frame} Depot Statistics ({start_date} - {current_day})"
-    else:
-        heading_text = f"{game_state.depot_time_frame} Depot Statistics ({start_date} - {current_day})"
+    # The arrow buttons are drawn on top of the cached panel, so hovering them needs no re-render
+    _draw_time_frame_buttons(screen, game_state, cache["title_rect"], mouse_pos)
+
+    # For backward compatibility, keep depot_plus_rect but set it to None
+    game_state.depot_plus_rect = None
+
+    # After all depot rendering, draw the detail panel if toggled visible
+    if detail_panel.visible:
+        detail_panel.draw(screen, font)
+
+def _depot_view_key(depot: 'Depot', game_state: 'GameState', rect: pygame.Rect, hovered_plus: Optional[str]) -> Tuple[Any, ...]:
+    """Collect everything the cached depot panel depends on.
     
-    title = font.render(heading_text, True, DARK_BROWN)
-    title_rect = title.get_rect(center=(x + width//2, y + 30))
-    screen.blit(title, title_rect)
+    Prices change hourly, and depot.stats_version advances with every trade and every
+    step of the daily bookkeeping (money, wealth, trade statistics), so date, hour and
+    stats_version cover all live values shown in the panel.
+    """
+    date = game_state.date
+    detail_panel = game_state.detail_panel
+    return (
+        (rect.x, rect.y, rect.width, rect.height), date.date(), date.hour,
+        depot.stats_version, depot.storage_capacity,
+        game_state.depot_time_frame, game_state.depot_scroll_offset,
+        detail_panel.visible, detail_panel.current_statistic, hovered_plus
+    )
+
+def _draw_time_frame_buttons(screen: pygame.Surface, game_state: 'GameState', title_rect: pygame.Rect, mouse_pos: Tuple[int, int]) -> None:
+    """Draw the buttons next to the heading which switch the depot time frame.
     
+    Args:
+        screen: The pygame surface to draw on.
+        game_state: Current game state object.
+        title_rect: Screen rectangle of the heading the buttons are placed around.
+        mouse_pos: Current mouse position for hover effects.
+    """
     # Define button size and positions relative to title
     btn_size = 30
     margin = 10  # margin between title and buttons
@@ -76,14 +145,13 @@ def draw_depot_view(screen: pygame.Surface, font: pygame.font.Font, depot: 'Depo
     button_border_color = DARK_BROWN
     default_arrow_color = DARK_BROWN
     hover_arrow_color = WHITE
-    arrow_font = pygame.font.SysFont("RomanAntique.ttf", 24)
-    mouse_pos = pygame.mouse.get_pos()
+    arrow_font = _get_arrow_font()
 
     if left_active:
         pygame.draw.rect(screen, button_bg_color, left_btn_rect, border_radius=5)
         pygame.draw.rect(screen, button_border_color, left_btn_rect, 2, border_radius=5)
         left_arrow_color = hover_arrow_color if left_btn_rect.collidepoint(mouse_pos) else default_arrow_color
-        arrow_text = arrow_font.render("<<", True, left_arrow_color)
+        arrow_text = render_text(arrow_font, "<<", left_arrow_color)
         arrow_rect = arrow_text.get_rect(center=left_btn_rect.center)
         screen.blit(arrow_text, arrow_rect)
     # Do not render left button if not active
@@ -92,52 +160,34 @@ def draw_depot_view(screen: pygame.Surface, font: pygame.font.Font, depot: 'Depo
         pygame.draw.rect(screen, button_bg_color, right_btn_rect, border_radius=5)
         pygame.draw.rect(screen, button_border_color, right_btn_rect, 2, border_radius=5)
         right_arrow_color = hover_arrow_color if right_btn_rect.collidepoint(mouse_pos) else default_arrow_color
-        arrow_text = arrow_font.render(">>", True, right_arrow_color)
+        arrow_text = render_text(arrow_font, ">>", right_arrow_color)
         arrow_rect = arrow_text.get_rect(center=right_btn_rect.center)
         screen.blit(arrow_text, arrow_rect)
     # Do not render right button if not active
 
-    # Initialize detail panel if not already set
-    if game_state.detail_panel is None:
-        from .depot_view_detail import DepotViewDetail
-        game_state.detail_panel = DepotViewDetail(depot_rect, game_state)
-        # Open "Current Wealth" by default
-        game_state.detail_panel.show_for_statistic("Current Wealth")
-    else:
-        # Update detail panel position in case the view moved
-        game_state.detail_panel.rect = pygame.Rect(depot_rect.left + 435, depot_rect.top + 60, 340, depot_rect.height-80)
+    # Store depot button rectangles for handling clicks externally
+    game_state.depot_buttons = {"left": left_btn_rect, "right": right_btn_rect}
 
-    # Prepare scrollable text area inside depot view (reserving 20px for scrollbar)
-    scroll_area = pygame.Rect(x, y + 60, width - 35, height -80)
-    # Create a temporary surface that is tall enough (estimate: current text section starts at 0)
-    content_surface = pygame.Surface((scroll_area.width, 1000), pygame.SRCALPHA)
-    content_surface.fill((0,0,0,0))
-    content_y = 0
+def _format_depot_stats(depot: 'Depot', game_state: 'GameState') -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]], List[Tuple[str, str]], List[Tuple[str, str, Tuple[int, int, int]]], Dict[str, Any]]:
+    """Calculate and format the statistics shown in the depot panel for the current time frame.
     
+    Args:
+        depot: Reference to the player's depot model.
+        game_state: Current game state object.
+        
+    Returns:
+        Tuple: Wealth, trade action and trade cycle rows as (label, value) pairs, the last trade
+        rows as (label, value, value color) and the raw trade cycle statistics.
+    """
     # Determine time frame period in days based on depot_time_frame
-    if game_state.depot_time_frame == "Daily":
-        period_days = 1
-    elif game_state.depot_time_frame == "Weekly":
-        period_days = 7
-    elif game_state.depot_time_frame == "Monthly":
-        period_days = 30
-    elif game_state.depot_time_frame == "Yearly":
-        period_days = 365
-    else:  # "Total"
-        period_days = None
+    period_days = TIME_FRAME_DAYS.get(game_state.depot_time_frame)
 
     # Calculate live wealth and start wealth based on time frame
     live_goods_value = sum(depot.good_stock.get(g.name, 0) * g.price for g in game_state.game.goods)
     current_wealth = depot.money + live_goods_value
     
-    if period_days is not None:
-        # For Daily (period_days=1), start_wealth is yesterday's closing wealth (depot.wealth[-1])
-        if len(depot.wealth) >= period_days:
-            start_wealth = depot.wealth[-period_days]
-        else:
-            start_wealth = depot.wealth[0]
-    else:
-        start_wealth = depot.wealth[0]
+    # For Daily (period_days=1), start_wealth is yesterday's closing wealth (depot.wealth[-1])
+    start_wealth = depot.wealth_start_for(period_days)
         
     wealth_change = current_wealth - start_wealth
 
@@ -155,15 +205,9 @@ def draw_depot_view(screen: pygame.Surface, font: pygame.font.Font, depot: 'Depo
         current_income = sum(depot.income_history) + depot.income
         current_expense = sum(depot.expenditure_history) + depot.expenditures
 
-    # Filter trades by time frame for trade action stats
-    if period_days is not None:
-        delta = datetime.timedelta(days=period_days)
-        filtered_trades = [trade for trade in depot.trades if trade["timestamp"] >= game_state.date - delta]
-    else:
-        filtered_trades = depot.trades
-    buy_actions = sum(1 for trade in filtered_trades if trade["type"] == "purchase")
-    sell_actions = sum(1 for trade in filtered_trades if trade["type"] == "sale")
-    total_actions = len(filtered_trades)
+    # Trade actions within the time frame, aggregated per day by the depot
+    buy_actions, sell_actions = depot.get_trade_action_counts(period_days)
+    total_actions = buy_actions + sell_actions
     
     wealth_stats = [
         ("Current Wealth", f"{current_wealth:,.2f}"),
@@ -182,11 +226,7 @@ def draw_depot_view(screen: pygame.Surface, font: pygame.font.Font, depot: 'Depo
     ]
     
     # Get trade cycle statistics filtered by time frame
-    if period_days is not None:
-        delta = datetime.timedelta(days=period_days)
-        cycle_stats = depot.get_trade_cycle_stats(game_state.date, delta)
-    else:
-        cycle_stats = depot.get_trade_cycle_stats(game_state.date, None)
+    cycle_stats = depot.get_period_trade_cycle_stats(period_days)
     
     # Convert cycle_stats dictionary to a list for display
     trade_cycle_stats = [
@@ -195,6 +235,75 @@ def draw_depot_view(screen: pygame.Surface, font: pygame.font.Font, depot: 'Depo
         ("Success Rate", f"{cycle_stats['success_rate']:.1f}%"),
         ("Total Trade Profit", f"{cycle_stats['total_profit']:,.2f}")
     ]
+    
+    # Most recent trade, formatted here so it is only redone when a new trade is recorded
+    last_trade_stats = []
+    if depot.trades:
+        last_trade = depot.trades[-1]
+        trade_type = "Purchase" if last_trade["type"] == "purchase" else "Sale"
+        trade_color = RED if last_trade["type"] == "purchase" else GREEN
+        
+        last_trade_stats = [
+            ("Good", last_trade["good"], BLACK),
+            ("Type", trade_type, trade_color),
+            ("Quantity", f"{last_trade['quantity']:,}", BLACK),
+            ("Price", f"{last_trade['price']:,.2f}", BLACK),
+            ("Total", f"{last_trade['total']:,.2f}", BLACK),
+        ]
+    
+    return wealth_stats, trade_action_stats, trade_cycle_stats, last_trade_stats, cycle_stats
+
+def _render_depot_panel(font: pygame.font.Font, depot: 'Depot', game_state: 'GameState', rect: pygame.Rect, hovered_plus: Optional[str]) -> Tuple[pygame.Surface, pygame.Rect]:
+    """Render the depot statistics (everything except the time frame buttons) into a panel surface.
+    
+    Args:
+        font: Main font for text rendering.
+        depot: Reference to the player's depot model.
+        game_state: Current game state object.
+        rect: Screen rectangle of the depot view.
+        hovered_plus: Label of the statistic whose detail button is hovered, if any.
+        
+    Returns:
+        Tuple[pygame.Surface, pygame.Rect]: The rendered panel and the heading rect in screen coordinates.
+    """
+    width = rect.width
+    height = rect.height
+    
+    # Start from a copy of the pre-drawn depot container
+    panel = _get_chrome(width, height).copy()
+    
+    # Draw heading with time frame
+    current_day = game_state.date.strftime("%d.%m.%Y")
+    
+    # Calculate start date based on time frame
+    if game_state.depot_time_frame == "Daily":
+        start_date = game_state.date.strftime("%d.%m.%Y")
+    elif game_state.depot_time_frame == "Weekly":
+        start_date = (game_state.date - datetime.timedelta(days=6)).strftime("%d.%m.%Y")
+    elif game_state.depot_time_frame == "Monthly":
+        start_date = (game_state.date - datetime.timedelta(days=29)).strftime("%d.%m.%Y")
+    elif game_state.depot_time_frame == "Yearly":
+        start_date = (game_state.date - datetime.timedelta(days=364)).strftime("%d.%m.%Y")
+    else:  # "Total"
+        start_date = START_DATE  # Game start date
+    
+    heading_text = f"{game_state.depot_time_frame} Depot Statistics ({start_date} - {current_day})"
+    title = render_text(font, heading_text, DARK_BROWN)
+    title_rect = title.get_rect(center=(width//2, 30))
+    panel.blit(title, title_rect)
+
+    # Prepare scrollable text area inside depot view (reserving 20px for scrollbar)
+    scroll_area = pygame.Rect(0, 60, width - 35, height -80)
+    content_y = 0
+    
+    # Formatted statistics only change with the depot's bookkeeping, hourly prices and the time frame
+    cache = game_state.depot_view_cache
+    date = game_state.date
+    stats_key = (depot.stats_version, depot.money, depot.storage_capacity, date.date(), date.hour, game_state.depot_time_frame)
+    if cache.get("stats_key") != stats_key:
+        cache["stats"] = _format_depot_stats(depot, game_state)
+        cache["stats_key"] = stats_key
+    wealth_stats, trade_action_stats, trade_cycle_stats, last_trade_stats, cycle_stats = cache["stats"]
 
     # Use game_state.depot_scroll_offset if it exists, otherwise default to 0
     scroll_offset = getattr(game_state, "depot_scroll_offset", 0)
@@ -202,6 +311,14 @@ def draw_depot_view(screen: pygame.Surface, font: pygame.font.Font, depot: 'Depo
     if scroll_offset < 0:
         scroll_offset = 0
     
+    # Text blits are collected here and submitted in one batch once all rows are laid out
+    blit_seq: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+    
+    # Looked up once for all rows instead of inside draw_row
+    small_font = game_state.small_font
+    detail_panel = getattr(game_state, "detail_panel", None)
+    selected_label = detail_panel.current_statistic if detail_panel is not None and detail_panel.visible else None
+    
     def draw_row(surf: pygame.Surface, 
                  y_pos: int, 
                  label: str, 
@@ -211,6 +328,8 @@ def draw_depot_view(screen: pygame.Surface, font: pygame.font.Font, depot: 'Depo
         ) -> None:
         """Helper function to draw a single row with label and value.
         
+        Backgrounds and lines are drawn immediately, text blits are queued in blit_seq.
+        
         Args:
             surf: Surface to draw the row onto.
             y_pos: Vertical position in pixels.
@@ -220,14 +339,8 @@ def draw_depot_view(screen: pygame.Surface, font: pygame.font.Font, depot: 'Depo
             value_color: Color of the value text.
         """
         
-        #small_font = pygame.font.SysFont("RomanAntique.ttf", 19)
-        small_font = game_state.small_font
-        
         # Check if this row is currently selected (its detail panel is open)
-        is_selected = (hasattr(game_state, "detail_panel") and 
-                     game_state.detail_panel is not None and
-                     game_state.detail_panel.visible and 
-                     game_state.detail_panel.current_statistic == label)
+        is_selected = label == selected_label
         
         # Draw a subtle gray background for the selected row
         if is_selected:
@@ -236,21 +349,13 @@ def draw_depot_view(screen: pygame.Surface, font: pygame.font.Font, depot: 'Depo
             pygame.draw.rect(surf, LIGHT_GRAY, row_rect)
             pygame.draw.rect(surf, BEIGE, row_separator)
         
-        labels_without_button = ["Current Wealth", "Wealth Start", "Total Stock", "Buy Actions", "Sell Actions", "Total Actions"]
-        if label in labels_without_button:
+        if label in _BUTTON_LABELS:
             # Create a more visible button instead of just the text
             button_size = 16
             button_rect = pygame.Rect(20, y_pos, button_size, button_size)
             
-            # Get mouse position (in content surface coordinates)
-            mouse_pos = pygame.mouse.get_pos()
-            # Convert mouse position to content surface coordinates
-            content_mouse_x = mouse_pos[0] - scroll_area.x
-            content_mouse_y = mouse_pos[1] - scroll_area.y + scroll_offset
-            
             # Check if mouse is hovering over this button
-            button_hover = (20 <= content_mouse_x <= 20 + button_size and 
-                           y_pos <= content_mouse_y <= y_pos + button_size)
+            button_hover = label == hovered_plus
             
             # Draw button with plus/minus sign
             button_bg_color = SANDY_BROWN if button_hover else TAN
@@ -263,10 +368,10 @@ def draw_depot_view(screen: pygame.Surface, font: pygame.font.Font, depot: 'Depo
             # Add plus/minus symbol centered in button with hover effect
             button_text = "-" if show_minus else "+"
             text_color = WHITE if button_hover else DARK_BROWN
-            plus_surf = small_font.render(button_text, True, text_color)
+            plus_surf = static_text(small_font, button_text, text_color)  # only four variants, rendered once each
             plus_rect = plus_surf.get_rect(center=button_rect.center)
             plus_rect.y -= 3  # Shift the text up, the chosen font type is leaning to the bottom
-            surf.blit(plus_surf, plus_rect)
+            blit_seq.append((plus_surf, plus_rect.topleft))
             
             # Store all button positions in a dictionary instead of just one
             if not hasattr(game_state, "depot_plus_buttons"):
@@ -280,108 +385,108 @@ def draw_depot_view(screen: pygame.Surface, font: pygame.font.Font, depot: 'Depo
         # Use bold effect for selected row
         if is_selected:
             # For bold text, render it twice with a small offset (simulating bold)
-            label_surf = small_font.render(label, True, label_color)
-            value_surf = small_font.render(value, True, value_color)
+            label_surf = static_text(small_font, label, label_color)
+            value_surf = render_text(small_font, value, value_color)
             
             # First render (offset by 1 pixel)
-            surf.blit(label_surf, (label_x+1, y_pos))
-            surf.blit(value_surf, (251, y_pos))
+            blit_seq.append((label_surf, (label_x+1, y_pos)))
+            blit_seq.append((value_surf, (251, y_pos)))
             
             # Second render (original position)
-            surf.blit(label_surf, (label_x, y_pos))
-            surf.blit(value_surf, (250, y_pos))
+            blit_seq.append((label_surf, (label_x, y_pos)))
+            blit_seq.append((value_surf, (250, y_pos)))
         else:
             # Normal rendering for non-selected rows
-            label_surf = small_font.render(label, True, label_color)
-            value_surf = small_font.render(value, True, value_color)
-            surf.blit(label_surf, (label_x, y_pos))
-            surf.blit(value_surf, (250, y_pos))
+            label_surf = static_text(small_font, label, label_color)
+            value_surf = render_text(small_font, value, value_color)
+            blit_seq.append((label_surf, (label_x, y_pos)))
+            blit_seq.append((value_surf, (250, y_pos)))
             
         # Draw separator line after specific rows
-        if label in ["Total Stock", "Total Actions", "Total Trade Profit", "Total"]:
+        if label in _SEPARATOR_LABELS:
             separator_y = y_pos + 20  # Position the line 20px below the text
             pygame.draw.line(surf, PALE_BROWN, (20, separator_y), (surf.get_width()-60, separator_y), 1)
     
-    # Draw section: Wealth Statistics
-    section_title = font.render("Wealth Statistics", True, DARK_BROWN)
-    content_surface.blit(section_title, (20, content_y))
+    # Lay out all section titles and rows first, so the content surface can be
+    # allocated with its exact height before anything is drawn
+    section_titles: List[Tuple[int, str]] = []
+    rows: List[Tuple[int, str, str, Tuple[int, int, int]]] = []
+    
+    # Section: Wealth Statistics
+    section_titles.append((content_y, "Wealth Statistics"))
     content_y += 30
     for label, value in wealth_stats:
-        draw_row(content_surface, content_y, label, value)
+        rows.append((content_y, label, value, BLACK))
         content_y += 24
     
-    # Draw section: Trade Actions
+    # Section: Trade Actions
     content_y += 15
-    section_title = font.render("Trade Actions", True, DARK_BROWN)
-    content_surface.blit(section_title, (20, content_y))
+    section_titles.append((content_y, "Trade Actions"))
     content_y += 30
     for label, value in trade_action_stats:
-        draw_row(content_surface, content_y, label, value)
+        rows.append((content_y, label, value, BLACK))
         content_y += 24
     
-    # Draw section: Trade Cycles
+    # Section: Trade Cycles
     content_y += 15
-    section_title = font.render("Trade Cycles", True, DARK_BROWN)
-    content_surface.blit(section_title, (20, content_y))
+    section_titles.append((content_y, "Trade Cycles"))
     content_y += 30
     for label, value in trade_cycle_stats:
-        draw_row(content_surface, content_y, label, value)
+        rows.append((content_y, label, value, BLACK))
         content_y += 24
 
-    # Draw most recent trade if available
-    if depot.trades:
+    # Most recent trade if available
+    if last_trade_stats:
         content_y += 15
-        last_trade = depot.trades[-1]
-        section_title = font.render("Last Trade", True, DARK_BROWN)
-        content_surface.blit(section_title, (20, content_y))
+        section_titles.append((content_y, "Last Trade"))
         content_y += 30
-        
-        trade_type = "Purchase" if last_trade["type"] == "purchase" else "Sale"
-        trade_color = RED if last_trade["type"] == "purchase" else GREEN
-        
-        draw_row(content_surface, content_y, "Good", last_trade["good"])
-        content_y += 24
-        draw_row(content_surface, content_y, "Type", trade_type, value_color=trade_color)
-        content_y += 24
-        draw_row(content_surface, content_y, "Quantity", f"{last_trade['quantity']:,}")
-        content_y += 24
-        draw_row(content_surface, content_y, "Price", f"{last_trade['price']:,.2f}")
-        content_y += 24
-        draw_row(content_surface, content_y, "Total", f"{last_trade['total']:,.2f}")
-        content_y += 24
+        for label, value, value_color in last_trade_stats:
+            rows.append((content_y, label, value, value_color))
+            content_y += 24
     
-    # Draw section: Best & Worst Goods
+    # Section: Best & Worst Goods
     if cycle_stats["best_goods"] or cycle_stats["worst_goods"]:
         content_y += 15
-        section_title = font.render("Performance by Good", True, DARK_BROWN)
-        content_surface.blit(section_title, (20, content_y))
+        section_titles.append((content_y, "Performance by Good"))
         content_y += 30
     
-    # Draw best goods if available
+    # Best goods if available
     if cycle_stats["best_goods"]:
-        draw_row(content_surface, content_y, "Best Performing Goods:", "Profit/Unit")
+        rows.append((content_y, "Best Performing Goods:", "Profit/Unit", BLACK))
         content_y += 24
         for i, (good_name, profit) in enumerate(cycle_stats["best_goods"][:3]):
             if profit > 0:
-                draw_row(content_surface, content_y, f"   {i+1}. {good_name}", f"+{profit:,.2f}")
+                rows.append((content_y, f"   {i+1}. {good_name}", f"+{profit:,.2f}", BLACK))
                 content_y += 24
     
-    # Draw worst goods if available
+    # Worst goods if available
     if cycle_stats["worst_goods"]:
         content_y += 5
-        draw_row(content_surface, content_y, "Worst Performing Goods:", "Profit/Unit")
+        rows.append((content_y, "Worst Performing Goods:", "Profit/Unit", BLACK))
         content_y += 24
         for i, (good_name, profit) in enumerate(reversed(cycle_stats["worst_goods"][-3:])):
             color = RED if profit < 0 else BLACK
-            draw_row(content_surface, content_y, f"   {i+1}. {good_name}", f"{profit:,.2f}", value_color=color)
+            rows.append((content_y, f"   {i+1}. {good_name}", f"{profit:,.2f}", color))
             content_y += 24
 
-    # add a visual closing as the last line to the content
-    pygame.draw.line(content_surface, DARK_BROWN, (20, content_y+10), (410, content_y+10), 2)
+    # Room for the closing line
+    closing_y = content_y + 10
     content_y += 20
 
-    # Crop the content_surface to the actual content height
-    content_surface = content_surface.subsurface(pygame.Rect(0, 0, scroll_area.width, content_y)).copy()
+    # Allocate the content surface with its exact final height
+    content_surface = pygame.Surface((scroll_area.width, content_y), pygame.SRCALPHA)
+    content_surface.fill((0,0,0,0))
+    
+    for title_y, title_text in section_titles:
+        blit_seq.append((_section_title(font, title_text), (20, title_y)))
+    for row_y, label, value, value_color in rows:
+        draw_row(content_surface, row_y, label, value, value_color=value_color)
+
+    # Submit all queued text in one batch
+    blit_batch(content_surface, blit_seq)
+
+    # add a visual closing as the last line to the content
+    pygame.draw.line(content_surface, DARK_BROWN, (20, closing_y), (410, closing_y), 2)
     
     # Update max_offset after content is created
     max_offset = max(0, content_surface.get_height() - scroll_area.height)
@@ -389,23 +494,21 @@ def draw_depot_view(screen: pygame.Surface, font: pygame.font.Font, depot: 'Depo
         scroll_offset = max_offset
     game_state.depot_scroll_offset = scroll_offset
 
-    # Blit the visible content portion onto the screen
-    screen.set_clip(scroll_area)
-    screen.blit(content_surface, (scroll_area.x, scroll_area.y), area=pygame.Rect(0, scroll_offset, scroll_area.width, scroll_area.height))
-    screen.set_clip(None)
+    # Blit the visible content portion onto the panel
+    panel.blit(content_surface, (scroll_area.x, scroll_area.y), area=pygame.Rect(0, scroll_offset, scroll_area.width, scroll_area.height))
     
     # Draw scrollbar if content is taller than scroll area
     if content_surface.get_height() > scroll_area.height:
         scrollbar_width = 10
         scrollbar_x = scroll_area.right
         scrollbar_rect = pygame.Rect(scrollbar_x, scroll_area.y, scrollbar_width, scroll_area.height)
-        pygame.draw.rect(screen, LIGHT_GRAY, scrollbar_rect)  # Track
+        pygame.draw.rect(panel, LIGHT_GRAY, scrollbar_rect)  # Track
         
         # thumb height proportional to visible fraction
         thumb_height = max(20, scroll_area.height * scroll_area.height / content_surface.get_height())
         thumb_y = scroll_area.y + (scroll_offset / (content_surface.get_height() - scroll_area.height)) * (scroll_area.height - thumb_height)
         thumb_rect = pygame.Rect(scrollbar_x, thumb_y, scrollbar_width, thumb_height)
-        pygame.draw.rect(screen, TAN, thumb_rect)
+        pygame.draw.rect(panel, TAN, thumb_rect)
 
     # After cropping and calculating scroll offset, convert stored button positions to screen coordinates
     if hasattr(game_state, "depot_plus_buttons"):
@@ -413,20 +516,11 @@ def draw_depot_view(screen: pygame.Surface, font: pygame.font.Font, depot: 'Depo
         for label, (btn_x, btn_y, btn_w, btn_h) in game_state.depot_plus_buttons.items():
             # Only create clickable rect if button is actually visible in current scroll view
             if btn_y >= scroll_offset and btn_y <= scroll_offset + scroll_area.height:
-                screen_y = scroll_area.y + (btn_y - scroll_offset)
-                screen_x = scroll_area.x + btn_x
+                screen_y = rect.y + scroll_area.y + (btn_y - scroll_offset)
+                screen_x = rect.x + scroll_area.x + btn_x
                 game_state.depot_plus_rects[label] = pygame.Rect(screen_x, screen_y, btn_w, btn_h)
 
-    # For backward compatibility, keep depot_plus_rect but set it to None
-    game_state.depot_plus_rect = None
-
-    # Store depot button rectangles for handling clicks externally
-    game_state.depot_buttons = {"left": left_btn_rect, "right": right_btn_rect}
-
-    # After all depot rendering, draw the detail panel if toggled visible
-    if hasattr(game_state, "detail_panel") and game_state.detail_panel is not None:
-        if game_state.detail_panel.visible:
-            game_state.detail_panel.draw(screen, font)
+    return panel, title_rect.move(rect.x, rect.y)
 
 def draw_stat_row(screen: pygame.Surface, 
                   font: pygame.font.Font, 
@@ -450,7 +544,7 @@ def draw_stat_row(screen: pygame.Surface,
         value_color: Color for the value.
     """
 
-    label_surf = font.render(label, True, label_color)
-    value_surf = font.render(value, True, value_color)
+    label_surf = render_text(font, label, label_color)
+    value_surf = render_text(font, value, value_color)
     screen.blit(label_surf, (x + 20, y))
     screen.blit(value_surf, (x + 250, y))
@@ -1,7 +1,32 @@
 import pygame
 from ...config.colors import YELLOW, BLACK, DARK_BROWN, TAN, BEIGE, PALE_BROWN, LIGHT_BROWN, WHEAT
-import datetime
-from typing import Dict, List, Optional, Any
+from operator import itemgetter
+from typing import Dict, List, Optional, Any, Set, Tuple
+from ...config.constants import TIME_FRAME_DAYS
+from ..helper_modules.text_cache import render_text, static_text, blit_batch
+
+# Detail lines are tagged tuples, formatted once when the statistics are rebuilt:
+#   ("kv", indent, label, value)  label/value row, indent in characters (8 pixels each)
+#   ("good", name)                good heading, drawn with its icon
+#   ("sep",)                      separator line
+#   ("blank",)                    empty line
+DetailLine = Tuple[Any, ...]
+
+# Groups of statistics that are rebuilt together
+_ALL_GROUPS = ("Current Wealth", "Wealth Start", "Total Stock", "Trade Actions")
+
+# Sort keys for the (good, qty, price, value) breakdown entries
+_BY_UNITS = itemgetter(1)
+_BY_VALUE = itemgetter(3)
+_SEPARATOR: DetailLine = ("sep",)
+_BLANK: DetailLine = ("blank",)
+
+# Shown for statistics without detail data yet (kept as one object so the panel cache stays valid)
+_PLACEHOLDER_LINES: List[DetailLine] = [
+    ("kv", 0, "Income:", "1,240.00"),
+    ("kv", 0, "Expenses:", "450.00"),
+    ("kv", 0, "Profit:", "790.00"),
+]
 
 class DepotViewDetail:
     """Handles the detailed statistics panel shown alongside the depot view.
@@ -10,6 +35,14 @@ class DepotViewDetail:
     filtered by the currently selected time frame.
     """
     
+    # Fixed attribute set: no per-instance __dict__ and faster attribute access in draw()
+    __slots__ = (
+        "rect", "visible", "current_statistic", "game_state", "small_font", "_goods_images",
+        "scroll_offset", "max_scroll", "cached_stats", "_dirty",
+        "_cached_surf", "_cached_content", "_cached_key", "_cached_lines", "content_height",
+        "_panel_surface", "_panel_scroll", "_valued_stock", "_valued_stock_key",
+    )
+    
     def __init__(self, depot_rect: pygame.Rect, game_state: Any) -> None:
         """Initialize the detail panel.
         
@@ -22,11 +55,13 @@ class DepotViewDetail:
         self.visible = False
         self.current_statistic = None
         self.game_state = game_state
+        self.small_font: pygame.font.Font = game_state.small_font  # Font for the detail lines, resolved once
+        self._goods_images: Dict[str, pygame.Surface] = game_state.game.images.get('goods_24', {})  # Pre-scaled icons
         self.scroll_offset = 0
         self.max_scroll = 0
         
         # Add cache for wealth statistics
-        self.cached_stats: Dict[str, List[str]] = {
+        self.cached_stats: Dict[str, List[DetailLine]] = {
             "Current Wealth": [],
             "Wealth Start": [],
             "Total Stock": [],
@@ -34,16 +69,25 @@ class DepotViewDetail:
             "Sell Actions": [],
             "Total Actions": []
         }
-        self.last_update_date: Optional[datetime.date] = None
-        self.last_time_frame: Optional[str] = None      # Track the last time frame to detect changes
-        self.last_hour: Optional[int] = None            # Track the last hour to detect price changes
-        self.last_money: Optional[float] = None         # Track the last money to detect trade changes
-        # Add separate flags to track when each statistic was last updated
-        self.last_today_update_date: Optional[datetime.date] = None
-        self.last_start_update_date: Optional[datetime.date] = None
-        self.last_total_stock_update_date: Optional[datetime.date] = None
-        self.last_trade_actions_update_date: Optional[datetime.date] = None
-        self.last_trade_actions_count: int = 0
+        # Statistic groups whose cached lines are out of date; a group is only rebuilt while
+        # it is shown. Depot and game state report changes, so nothing is polled per frame.
+        self._dirty: Set[str] = set(_ALL_GROUPS)
+        game_state.game.depot.register_invalidation_listener(self._on_depot_changed)
+        game_state.register_time_frame_listener(self._on_time_frame_changed)
+        game_state.register_hour_listener(self._on_hour_changed)
+        
+        # Pre-rendered panel surfaces, rebuilt only when statistic, size or lines change
+        self._cached_surf: Optional[pygame.Surface] = None
+        self._cached_content: Optional[pygame.Surface] = None
+        self._cached_key: Optional[tuple] = None
+        self._cached_lines: Optional[List[DetailLine]] = None
+        self.content_height: int = 0
+        self._panel_surface: Optional[pygame.Surface] = None  # frame, visible content and scrollbar in one surface
+        self._panel_scroll: int = 0                           # scroll offset the composed panel was made for
+        
+        # (good, qty, price, value) for every good in stock, shared by "Current Wealth" and "Total Stock"
+        self._valued_stock: List[Tuple[Any, int, float, float]] = []
+        self._valued_stock_key: Optional[tuple] = None
 
     def toggle(self) -> None:
         """Toggle the visibility of the detail panel."""
@@ -61,131 +105,143 @@ class DepotViewDetail:
         self.visible = True
 
     def update_statistics(self, force: bool = False) -> None:
-        """Update cached statistics if state has changed or force is True.
+        """Update the cached statistics of the shown statistic if they are out of date or force is True.
         
-        Checks if day, hour, money, or time frame has changed since the last update.
+        Statistics that are not shown are left alone; they are rebuilt once they are
+        shown again if they were invalidated in the meantime.
         """
-        current_date = self.game_state.date.date()
-        current_hour = self.game_state.date.hour
-        current_time_frame = self.game_state.depot_time_frame
+        statistic = self.current_statistic
+        if statistic not in self.cached_stats:
+            return
+        
+        # Buy, Sell and Total Actions are built together
+        group = "Trade Actions" if statistic in ("Buy Actions", "Sell Actions", "Total Actions") else statistic
+        if not force and group not in self._dirty:
+            return
+        
         depot = self.game_state.game.depot
         goods = self.game_state.game.goods
-        current_money = depot.money
-        
-        # Update "Current Wealth" if day changed, hour changed, money changed, or forced
-        if (force or self.last_today_update_date != current_date or 
-            self.last_hour != current_hour or self.last_money != current_money):
+        time_frame = self.game_state.depot_time_frame
+        if group == "Current Wealth":
             self._update_current_wealth(depot, goods)
-            self.last_today_update_date = current_date
+        elif group == "Wealth Start":
+            self._update_wealth_start(depot, goods, time_frame)
+        elif group == "Total Stock":
+            self._update_total_stock(depot, goods)
+        else:
+            self._update_trade_actions(depot, goods, time_frame)
+        self._dirty.discard(group)
+    
+    def invalidate(self, *groups: str) -> None:
+        """Mark statistic groups as out of date; they are rebuilt when next shown.
+        
+        Args:
+            groups: "Current Wealth", "Wealth Start", "Total Stock" or "Trade Actions".
+                If none are given, all groups are invalidated.
+        """
+        self._dirty.update(groups or _ALL_GROUPS)
+    
+    def _on_depot_changed(self) -> None:
+        """Invalidate the statistics after a trade or the daily bookkeeping."""
+        self.invalidate("Current Wealth", "Total Stock", "Trade Actions")
+        # The "Total" start is the first record of every history and never changes
+        if self.game_state.depot_time_frame != "Total":
+            self.invalidate("Wealth Start")
+    
+    def _on_time_frame_changed(self) -> None:
+        """Invalidate the statistics that depend on the selected time frame."""
+        self.invalidate("Wealth Start", "Trade Actions")
+    
+    def _on_hour_changed(self) -> None:
+        """Invalidate the statistics that show current prices (prices change hourly)."""
+        self.invalidate("Current Wealth", "Total Stock")
+    
+    def _get_valued_stock(self, depot: Any, goods: List[Any]) -> List[Tuple[Any, int, float, float]]:
+        """Return (good, qty, price, value) for every good in stock, in goods order.
         
-        # Update "Wealth Start" if time frame changed, day changed, or forced
-        if force or self.last_start_update_date != current_date or self.last_time_frame != current_time_frame:
-            self._update_wealth_start(depot, goods, current_time_frame)
-            self.last_start_update_date = current_date
-            self.last_time_frame = current_time_frame
+        Stock changes with trades and prices change hourly, so the list is reused until
+        the depot statistics or the hour change.
         
-        # Update "Total Stock" if day changed, hour changed, money changed, or forced
-        if (force or self.last_total_stock_update_date != current_date or 
-            self.last_hour != current_hour or self.last_money != current_money):
-            self._update_total_stock(depot, goods)
-            self.last_total_stock_update_date = current_date
-        
-        # Update Trade Actions if time frame changed, day changed, trade count changed, or forced
-        current_trade_count = len(depot.trades)
-        if (force or self.last_trade_actions_update_date != current_date or 
-            self.last_time_frame != current_time_frame or 
-            self.last_trade_actions_count != current_trade_count):
-            self._update_trade_actions(depot, goods, current_time_frame)
-            self.last_trade_actions_update_date = current_date
-            self.last_trade_actions_count = current_trade_count
-
-        # Update tracking variables
-        self.last_update_date = current_date
-        self.last_hour = current_hour
-        self.last_money = current_money
+        Args:
+            depot: The player's depot.
+            goods: All goods of the game.
+        
+        Returns:
+            List[Tuple[Any, int, float, float]]: Entries for goods with a quantity > 0.
+        """
+        date = self.game_state.date
+        key = (depot.stats_version, date.date(), date.hour)
+        if self._valued_stock_key != key:
+            good_stock = depot.good_stock
+            valued = []
+            for good in goods:
+                qty = good_stock.get(good.name, 0)
+                if qty > 0:
+                    price = good.price
+                    valued.append((good, qty, price, qty * price))
+            self._valued_stock = valued
+            self._valued_stock_key = key
+        return self._valued_stock
     
     def _update_current_wealth(self, depot: Any, goods: List[Any]) -> None:
         """Update just the "Current Wealth" statistics.
         
         Calculates total wealth breakdown including money and current value of all goods.
         """
-        # Calculate total goods value for Current Wealth using current prices and stock
-        total_goods_value = 0
-        for good in goods:
-            qty = depot.good_stock.get(good.name, 0)
-            price = good.price
-            total_goods_value += qty * price
+        # The valued stock feeds both the total and the breakdown
+        goods_with_value = self._get_valued_stock(depot, goods)
+        total_goods_value = sum(entry[3] for entry in goods_with_value)
             
         # Cache "Current Wealth" statistics
-        self.cached_stats["Current Wealth"] = []
+        lines = self.cached_stats["Current Wealth"] = []
         
         # Add summary totals at the top
         total_wealth = depot.money + total_goods_value
-        self.cached_stats["Current Wealth"].append(f"Total: {total_wealth:,.2f}")
-        self.cached_stats["Current Wealth"].append("__SEPARATOR__")
-        self.cached_stats["Current Wealth"].append(f"Money: {depot.money:,.2f}")
-        self.cached_stats["Current Wealth"].append(f"Goods: {total_goods_value:,.2f}")
+        lines.append(("kv", 0, "Total:", f"{total_wealth:,.2f}"))
+        lines.append(_SEPARATOR)
+        lines.append(("kv", 0, "Money:", f"{depot.money:,.2f}"))
+        lines.append(("kv", 0, "Goods:", f"{total_goods_value:,.2f}"))
         # place holders for future statistics
-        self.cached_stats["Current Wealth"].append("Property: 0.00")
-        self.cached_stats["Current Wealth"].append("Loans: 0.00")
-        self.cached_stats["Current Wealth"].append("__SEPARATOR__")
+        lines.append(("kv", 0, "Property:", "0.00"))
+        lines.append(("kv", 0, "Loans:", "0.00"))
+        lines.append(_SEPARATOR)
         # empty line
-        self.cached_stats["Current Wealth"].append("")
-        
-        # Add breakdown for each good that has quantity > 0, sorted by total value
-        goods_with_value = []
-        for good in goods:
-            qty = depot.good_stock.get(good.name, 0)
-            if qty > 0:
-                price = good.price
-                value = qty * price
-                goods_with_value.append((good, qty, price, value))
-        
-        # Sort by value descending
-        goods_with_value.sort(key=lambda x: x[3], reverse=True)
+        lines.append(_BLANK)
         
-        for good, qty, price, value in goods_with_value:
+        # Add breakdown for each good that has quantity > 0, sorted by value descending
+        for good, qty, price, value in sorted(goods_with_value, key=_BY_VALUE, reverse=True):
             # Add good name as a heading without value
-            self.cached_stats["Current Wealth"].append(f"{good.name}")
+            lines.append(("good", good.name))
             # Add indented details
-            self.cached_stats["Current Wealth"].append(f"      Units: {qty:,}")
-            self.cached_stats["Current Wealth"].append(f"      Unit Value: {price:,.2f}")
-            self.cached_stats["Current Wealth"].append(f"      Total Value: {value:,.2f}")
-            self.cached_stats["Current Wealth"].append("__SEPARATOR__")
+            lines.append(("kv", 6, "Units:", f"{qty:,}"))
+            lines.append(("kv", 6, "Unit Value:", f"{price:,.2f}"))
+            lines.append(("kv", 6, "Total Value:", f"{value:,.2f}"))
+            lines.append(_SEPARATOR)
     
     def _update_total_stock(self, depot: Any, goods: List[Any]) -> None:
         """Update just the "Total Stock" statistics.
         
         Lists all goods currently in stock, sorted by total units descending.
         """
-        self.cached_stats["Total Stock"] = []
+        lines = self.cached_stats["Total Stock"] = []
         
         # Get current total units
         total_units = sum(depot.good_stock.values())
-        self.cached_stats["Total Stock"].append(f"Total Units: {total_units:,}")
-        self.cached_stats["Total Stock"].append("__SEPARATOR__")
-        self.cached_stats["Total Stock"].append("")
+        lines.append(("kv", 0, "Total Units:", f"{total_units:,}"))
+        lines.append(_SEPARATOR)
+        lines.append(_BLANK)
         
-        # Add breakdown for each good that has quantity > 0, sorted by units
-        goods_with_stock = []
-        for good in goods:
-            qty = depot.good_stock.get(good.name, 0)
-            if qty > 0:
-                price = good.price
-                value = qty * price
-                goods_with_stock.append((good, qty, price, value))
-        
-        # Sort by units descending (as requested)
-        goods_with_stock.sort(key=lambda x: x[1], reverse=True)
+        # Add breakdown for each good that has quantity > 0, sorted by units descending
+        goods_with_stock = sorted(self._get_valued_stock(depot, goods), key=_BY_UNITS, reverse=True)
         
         for good, qty, price, value in goods_with_stock:
             # Add good name as a heading
-            self.cached_stats["Total Stock"].append(f"{good.name}")
+            lines.append(("good", good.name))
             # Add indented details
-            self.cached_stats["Total Stock"].append(f"      Units: {qty:,}")
-            self.cached_stats["Total Stock"].append(f"      Unit Value: {price:,.2f}")
-            self.cached_stats["Total Stock"].append(f"      Total Value: {value:,.2f}")
-            self.cached_stats["Total Stock"].append("__SEPARATOR__")
+            lines.append(("kv", 6, "Units:", f"{qty:,}"))
+            lines.append(("kv", 6, "Unit Value:", f"{price:,.2f}"))
+            lines.append(("kv", 6, "Total Value:", f"{value:,.2f}"))
+            lines.append(_SEPARATOR)
     
     def _update_wealth_start(self, depot: Any, goods: List[Any], time_frame: str) -> None:
         """Update just the "Wealth Start" statistics based on selected time frame.
@@ -193,19 +249,10 @@ class DepotViewDetail:
         Reconstructs what the player's wealth and stocks were at the beginning of the period.
         """
         # Cache "Wealth Start" statistics based on selected time frame
-        self.cached_stats["Wealth Start"] = []
-        
-        # Determine period days based on the selected time frame
-        if time_frame == "Daily":
-            period_days = 1
-        elif time_frame == "Weekly":
-            period_days = 7
-        elif time_frame == "Monthly":
-            period_days = 30
-        elif time_frame == "Yearly":
-            period_days = 365
-        else:  # "Total"
-            period_days = None
+        lines = self.cached_stats["Wealth Start"] = []
+        
+        # Determine period days based on the selected time frame (None for "Total")
+        period_days = TIME_FRAME_DAYS.get(time_frame)
             
         # Get historical wealth and money values directly from records
         if period_days is not None and len(depot.wealth) > period_days:
@@ -215,28 +262,14 @@ class DepotViewDetail:
             start_wealth = depot.wealth[0]
             start_money = depot.money_history[0]  # Use recorded money directly
         
-        # Calculate start date for goods reconstruction
-        start_date = self.game_state.date - datetime.timedelta(days=period_days if period_days else 0)
-        
-        # Reconstruct goods quantities at the start 
-        start_goods = {good.name: depot.good_stock.get(good.name, 0) for good in goods}
-        
-        # Reverse through trades and undo them if they happened within the period
-        period_trades = []
-        if period_days is not None:
-            period_trades = [t for t in depot.trades if t["timestamp"] >= start_date]
-            
-        # Reconstruct trades in reverse
-        for trade in reversed(period_trades):
-            good_name = trade["good"]
-            qty = trade["quantity"]
-            
-            if trade["type"] == "purchase":
-                # If it was a purchase, we need to decrease the quantity
-                start_goods[good_name] = max(0, start_goods[good_name] - qty)
-            else:  # "sale"
-                # If it was a sale, we need to increase the quantity
-                start_goods[good_name] = start_goods[good_name] + qty
+        # Goods quantities at the start, read from the daily stock snapshots taken together with the wealth
+        start_goods = {}
+        for good in goods:
+            history = depot.stock_history.get(good.name, [0])
+            if period_days is not None and len(history) > period_days:
+                start_goods[good.name] = history[-(period_days+1)]
+            else:
+                start_goods[good.name] = history[0]
         
         # Get historic prices for each good at the start of the period
         start_prices = {}
@@ -247,23 +280,18 @@ class DepotViewDetail:
                 start_prices[good.name] = good.price_history_daily[0]
         
         # Calculate total goods value at start of period
-        start_goods_value = 0
-        for good in goods:
-            good_name = good.name
-            qty = start_goods.get(good_name, 0)
-            price = start_prices[good_name]
-            start_goods_value += qty * price
+        start_goods_value = sum(start_goods.get(name, 0) * price for name, price in start_prices.items())
         
         # Add calculated stats to cache
-        self.cached_stats["Wealth Start"].append(f"Total: {start_wealth:,.2f}")
-        self.cached_stats["Wealth Start"].append("__SEPARATOR__")
-        self.cached_stats["Wealth Start"].append(f"Money: {start_money:,.2f}")
-        self.cached_stats["Wealth Start"].append(f"Goods: {start_goods_value:,.2f}")
+        lines.append(("kv", 0, "Total:", f"{start_wealth:,.2f}"))
+        lines.append(_SEPARATOR)
+        lines.append(("kv", 0, "Money:", f"{start_money:,.2f}"))
+        lines.append(("kv", 0, "Goods:", f"{start_goods_value:,.2f}"))
         # place holders for future statistics
-        self.cached_stats["Wealth Start"].append("Property: 0.00")
-        self.cached_stats["Wealth Start"].append("Loans: 0.00")
-        self.cached_stats["Wealth Start"].append("__SEPARATOR__")
-        self.cached_stats["Wealth Start"].append("")
+        lines.append(("kv", 0, "Property:", "0.00"))
+        lines.append(("kv", 0, "Loans:", "0.00"))
+        lines.append(_SEPARATOR)
+        lines.append(_BLANK)
         
         # Show goods at start of period, sorted by total value
         goods_with_value = []
@@ -278,217 +306,220 @@ class DepotViewDetail:
                 goods_with_value.append((good_name, qty, price, total_value))
         
         # Sort by total value descending
-        goods_with_value.sort(key=lambda x: x[3], reverse=True)
+        goods_with_value.sort(key=_BY_VALUE, reverse=True)
         
         for good_name, qty, price, total_value in goods_with_value:
-            self.cached_stats["Wealth Start"].append(f"{good_name}")
-            self.cached_stats["Wealth Start"].append(f"      Units: {qty:,}")
-            self.cached_stats["Wealth Start"].append(f"      Unit Value: {price:,.2f}")
-            self.cached_stats["Wealth Start"].append(f"      Total Value: {total_value:,.2f}")
-            self.cached_stats["Wealth Start"].append("__SEPARATOR__")
+            lines.append(("good", good_name))
+            lines.append(("kv", 6, "Units:", f"{qty:,}"))
+            lines.append(("kv", 6, "Unit Value:", f"{price:,.2f}"))
+            lines.append(("kv", 6, "Total Value:", f"{total_value:,.2f}"))
+            lines.append(_SEPARATOR)
+    
     def _update_trade_actions(self, depot: Any, goods: List[Any], time_frame: str) -> None:
         """Update Buy, Sell, and Total Actions statistics based on selected time frame.
         
         Aggregates trade volumes and units by good for the chosen period.
         """
-        # Determine period days
-        if time_frame == "Daily":
-            period_days = 1
-        elif time_frame == "Weekly":
-            period_days = 7
-        elif time_frame == "Monthly":
-            period_days = 30
-        elif time_frame == "Yearly":
-            period_days = 365
-        else:  # "Total"
-            period_days = None
-
-        # Filter trades by time frame
-        if period_days is not None:
-            delta = datetime.timedelta(days=period_days)
-            start_date = self.game_state.date - delta
-            filtered_trades = [t for t in depot.trades if t["timestamp"] >= start_date]
-        else:
-            filtered_trades = depot.trades
+        # Slice trades by time frame, using the same day boundaries as the action counts of the depot view
+        start = depot.trade_start_index(TIME_FRAME_DAYS.get(time_frame))
+        filtered_trades = list(zip(depot.trade_types[start:], depot.trade_goods[start:],
+                                   depot.trade_quantities[start:], depot.trade_totals[start:]))
 
-        # Process Buy, Sell, and Total
-        for action_type in ["Buy Actions", "Sell Actions", "Total Actions"]:
-            self.cached_stats[action_type] = []
-            
-            if action_type == "Buy Actions":
-                type_filter = "purchase"
-            elif action_type == "Sell Actions":
-                type_filter = "sale"
+        # Aggregate Buy, Sell and Total in a single pass; each good maps to [units, total value]
+        buy_stats: Dict[str, List[float]] = {}
+        sell_stats: Dict[str, List[float]] = {}
+        total_stats: Dict[str, List[float]] = {}
+        buy_sums = [0, 0]     # [units, volume]
+        sell_sums = [0, 0]
+        total_sums = [0, 0]
+        purchase = depot.TRADE_PURCHASE
+        
+        for trade_type, name, quantity, total in filtered_trades:
+            if trade_type == purchase:
+                bucket, sums = buy_stats, buy_sums
             else:
-                type_filter = None
-
-            trades = [t for t in filtered_trades if type_filter is None or t["type"] == type_filter]
-            
-            # Aggregate by good
-            good_stats = {}
-            total_volume = 0
-            total_units = 0
-            volume_bought = 0
-            volume_sold = 0
-            units_bought = 0
-            units_sold = 0
+                bucket, sums = sell_stats, sell_sums
+            stats = bucket.get(name)
+            if stats is None:
+                stats = bucket[name] = [0, 0]
+            stats[0] += quantity
+            stats[1] += total
+            sums[0] += quantity
+            sums[1] += total
+            stats = total_stats.get(name)
+            if stats is None:
+                stats = total_stats[name] = [0, 0]
+            stats[0] += quantity
+            stats[1] += total
+            total_sums[0] += quantity
+            total_sums[1] += total
+        
+        for action_type, good_stats, (total_units, total_volume) in (
+                ("Buy Actions", buy_stats, buy_sums),
+                ("Sell Actions", sell_stats, sell_sums),
+                ("Total Actions", total_stats, total_sums)):
+            lines = self.cached_stats[action_type] = []
             
-            for t in trades:
-                name = t["good"]
-                if name not in good_stats:
-                    good_stats[name] = {"units": 0, "total_value": 0}
-                good_stats[name]["units"] += t["quantity"]
-                good_stats[name]["total_value"] += t["total"]
-                total_volume += t["total"]
-                total_units += t["quantity"]
-                
-                if action_type == "Total Actions":
-                    if t["type"] == "purchase":
-                        volume_bought += t["total"]
-                        units_bought += t["quantity"]
-                    else:
-                        volume_sold += t["total"]
-                        units_sold += t["quantity"]
-
             # Add summary
-            self.cached_stats[action_type].append(f"Total Volume: {total_volume:,.2f}")
-            self.cached_stats[action_type].append(f"Total Units: {total_units:,}")
+            lines.append(("kv", 0, "Total Volume:", f"{total_volume:,.2f}"))
+            lines.append(("kv", 0, "Total Units:", f"{total_units:,}"))
             
             if action_type == "Total Actions":
-                self.cached_stats[action_type].append(f"Volume Bought: {volume_bought:,.2f}")
-                self.cached_stats[action_type].append(f"Volume Sold: {volume_sold:,.2f}")
-                self.cached_stats[action_type].append(f"Units Bought: {units_bought:,}")
-                self.cached_stats[action_type].append(f"Units Sold: {units_sold:,}")
+                lines.append(("kv", 0, "Volume Bought:", f"{buy_sums[1]:,.2f}"))
+                lines.append(("kv", 0, "Volume Sold:", f"{sell_sums[1]:,.2f}"))
+                lines.append(("kv", 0, "Units Bought:", f"{buy_sums[0]:,}"))
+                lines.append(("kv", 0, "Units Sold:", f"{sell_sums[0]:,}"))
                 
-            self.cached_stats[action_type].append("__SEPARATOR__")
-            self.cached_stats[action_type].append("")
+            lines.append(_SEPARATOR)
+            lines.append(_BLANK)
 
             # Sort goods by total value descending
-            sorted_goods = sorted(good_stats.items(), key=lambda x: x[1]["total_value"], reverse=True)
+            sorted_goods = sorted(good_stats.items(), key=lambda x: x[1][1], reverse=True)
+
+            for name, (units, total_value) in sorted_goods:
+                avg_price = total_value / units if units > 0 else 0
+                lines.append(("good", name))
+                lines.append(("kv", 6, "Units:", f"{units:,}"))
+                lines.append(("kv", 6, "Avg Price:", f"{avg_price:,.2f}"))
+                lines.append(("kv", 6, "Total Value:", f"{total_value:,.2f}"))
+                lines.append(_SEPARATOR)
+    
+    def _build_panel_surface(self, font: pygame.font.Font, lines: List[DetailLine]) -> None:
+        """Pre-render the panel frame, title and all detail lines into cached surfaces.
+        
+        The frame (background, border, title) and the full-height content are rendered
+        separately so scrolling only needs a partial blit of the content surface.
+        
+        Args:
+            font: The font to use for titles.
+            lines: The detail lines to render.
+        """
+        small_font = self.small_font
+        
+        # Static frame with title
+        frame = pygame.Surface(self.rect.size)
+        frame_rect = frame.get_rect()
+        pygame.draw.rect(frame, WHEAT, frame_rect)  # WHEAT or TAN look good
+        pygame.draw.rect(frame, DARK_BROWN, frame_rect, 3)
+        
+        title_text = "Wealth Details"
+        if self.current_statistic:
+            title_text = f"{self.current_statistic} - Details"
+        frame.blit(static_text(font, title_text, BLACK), (20, 20))
+        
+        # Get good icons from game instance
+        goods_images = self._goods_images
+        
+        line_height = 24
+        width = self.rect.width
+        # Content height: all lines plus room for the closing line at the bottom
+        content_height = sum(1 for line in lines if line[0] != "sep") * line_height + 20
+        content = pygame.Surface((width - 15, content_height))
+        content.fill(WHEAT)
+        
+        # Labels, good names and the title come from a fixed set and stay cached for good;
+        # only the values go through the bounded shared text cache
+        blit_seq = []
+        y_pos = 0
+        
+        # Loop invariants bound to locals
+        add_blit = blit_seq.append
+        draw_line = pygame.draw.line
+        separator_right = width - 35
+        
+        # Render detail lines with values aligned on the right side
+        for line in lines:
+            tag = line[0]
+            if tag == "sep":
+                # Draw separator line, it takes no line of its own
+                draw_line(content, PALE_BROWN, (20, y_pos-5), (separator_right, y_pos-5), 1)
+                continue
+            
+            if tag == "kv":
+                _, indent, label, value = line
+                add_blit((static_text(small_font, label, BLACK), (20 + indent * 8, y_pos)))  # 8 pixels per indentation space
+                add_blit((render_text(small_font, value, BLACK), (180, y_pos)))
+            elif tag == "good":
+                name = line[1]
+                good_icon = goods_images.get(name)
+                if good_icon is not None:
+                    # Render the good icon (24px, slightly smaller than the original 30px) to the
+                    # left of the name, and the name with extra left padding for the icon
+                    add_blit((good_icon, (20, y_pos - 5)))
+                    add_blit((static_text(small_font, name, BLACK), (50, y_pos)))
+                else:
+                    add_blit((static_text(small_font, name, BLACK), (20, y_pos)))
+            y_pos += line_height
+        blit_batch(content, blit_seq)
+        
+        # add a visual closing as the last line to the content
+        pygame.draw.line(content, DARK_BROWN, (20, y_pos+10), (width - 35, y_pos+10), 2)
+        
+        self._cached_surf = frame
+        self._cached_content = content
+        self._cached_key = (self.current_statistic, self.rect.size)
+        self._cached_lines = lines
+        self.content_height = content_height
+        self._panel_surface = None  # composed panel is out of date
 
-            for name, stats in sorted_goods:
-                avg_price = stats["total_value"] / stats["units"] if stats["units"] > 0 else 0
-                self.cached_stats[action_type].append(f"{name}")
-                self.cached_stats[action_type].append(f"      Units: {stats['units']:,}")
-                self.cached_stats[action_type].append(f"      Avg Price: {avg_price:,.2f}")
-                self.cached_stats[action_type].append(f"      Total Value: {stats['total_value']:,.2f}")
-                self.cached_stats[action_type].append("__SEPARATOR__")    
     def draw(self, screen: pygame.Surface, font: pygame.font.Font) -> None:
         """Draw the detail panel and its content to the screen.
         
+        The panel is rendered into cached surfaces which are only rebuilt when the
+        selected statistic, the panel size or the cached lines change; unchanged
+        frames take a single blit.
+        
         Args:
             screen: The surface to draw on.
             font: The font to use for titles.
         """
         if self.visible:
-            # Update statistics if needed
-            self.update_statistics()
-            
-            pygame.draw.rect(screen, WHEAT, self.rect)  # WHEAT or TAN look good
-            pygame.draw.rect(screen, DARK_BROWN, self.rect, 3)
-            
-            small_font = self.game_state.small_font
-            if hasattr(font, 'game_state') and hasattr(font.game_state, 'small_font'):
-                small_font = font.game_state.small_font
-            
-            title_text = "Wealth Details"
-            if self.current_statistic:
-                title_text = f"{self.current_statistic} - Details"
-                
-            title = font.render(title_text, True, BLACK)
-            screen.blit(title, (self.rect.x + 20, self.rect.y + 20))
-            
-            # Define the scrollable area (reserving space for scrollbar)
-            scroll_area = pygame.Rect(self.rect.x, self.rect.y + 60, self.rect.width - 15, self.rect.height - 80)
-            
-            # Set clipping to the scroll area
-            old_clip = screen.get_clip()
-            screen.set_clip(scroll_area)
-            
-            y_pos = self.rect.y + 60 - self.scroll_offset
-            line_height = 24
-            
-            # Get good icons from game instance
-            goods_images = None
-            if hasattr(self.game_state, 'game') and hasattr(self.game_state.game, 'images'):
-                goods_images = self.game_state.game.images.get('goods_30', {})
+            # Update statistics only if something was invalidated
+            if self._dirty:
+                self.update_statistics()
             
             # Use cached statistics if available
-            lines = []
             if self.current_statistic in self.cached_stats:
                 lines = self.cached_stats[self.current_statistic]
             else:
-                lines.extend([
-                    "Income: 1,240.00",
-                    "Expenses: 450.00",
-                    "Profit: 790.00",
-                ])
+                lines = _PLACEHOLDER_LINES
             
-            # Render detail lines with values aligned on the right side
-            for line in lines:
-                # Check if this is a separator marker
-                if line == "__SEPARATOR__":
-                    # Draw separator line
-                    pygame.draw.line(screen, PALE_BROWN, 
-                                    (self.rect.x + 20, y_pos-5), 
-                                    (self.rect.x + self.rect.width - 35, y_pos-5), 1)
-                    continue  # Skip rendering this line
-                
-                # Calculate indentation level (number of spaces at beginning)
-                indent_level = len(line) - len(line.lstrip())
-                indent_pixels = indent_level * 8  # 8 pixels per indentation space
-                
-                # Remove leading spaces for rendering
-                display_line = line.lstrip()
-                
-                # Check if this line is just a good name (not indented and no colon)
-                is_good_name = indent_level == 0 and ":" not in display_line
-                
-                if is_good_name and goods_images and display_line in goods_images:
-                    # Render the good icon
-                    good_icon = goods_images[display_line]
-                    # Scale down the icon slightly if needed
-                    icon_size = 24  # Slightly smaller than the original 30px
-                    if good_icon.get_width() > icon_size:
-                        good_icon = pygame.transform.scale(good_icon, (icon_size, icon_size))
-                    
-                    # Render good icon to the left of the name
-                    screen.blit(good_icon, (self.rect.x + 20, y_pos - 5))
-                    
-                    # Render the good name with extra left padding for the icon
-                    good_text = small_font.render(display_line, True, BLACK)
-                    screen.blit(good_text, (self.rect.x + 50, y_pos))
-                elif ":" in display_line:
-                    parts = display_line.split(":", 1)
-                    label_part = parts[0].strip() + ":"
-                    value_part = parts[1].strip()
-                    label_surf = small_font.render(label_part, True, BLACK)
-                    value_surf = small_font.render(value_part, True, BLACK)
-                    screen.blit(label_surf, (self.rect.x + 20 + indent_pixels, y_pos))
-                    screen.blit(value_surf, (self.rect.x + 180, y_pos))
-                else:
-                    text = small_font.render(display_line, True, BLACK)
-                    screen.blit(text, (self.rect.x + 20 + indent_pixels, y_pos))
-                y_pos += line_height
-            
-            # add a visual closing as the last line to the content
-            pygame.draw.line(screen, DARK_BROWN, (self.rect.x + 20, y_pos+10), (self.rect.x + self.rect.width - 35, y_pos+10), 2)
-            
-            # Calculate max scroll
-            content_height = (y_pos + self.scroll_offset + 20) - (self.rect.y + 60)
-            self.max_scroll = max(0, content_height - scroll_area.height)
+            if (self._cached_surf is None or self._cached_lines is not lines or
+                    self._cached_key != (self.current_statistic, self.rect.size)):
+                self._build_panel_surface(font, lines)
             
-            # Reset clipping
-            screen.set_clip(old_clip)
+            # Frame, visible content and scrollbar are composed once per content and scroll position
+            if self._panel_surface is None or self._panel_scroll != self.scroll_offset:
+                self._compose_panel()
+            screen.blit(self._panel_surface, self.rect.topleft)
+    
+    def _compose_panel(self) -> None:
+        """Compose the cached frame, the visible part of the content and the scrollbar into one surface."""
+        width, height = self.rect.size
+        panel = self._cached_surf.copy()
+        
+        # Define the scrollable area (reserving space for scrollbar)
+        scroll_area = pygame.Rect(0, 60, width - 15, height - 80)
+        
+        # Calculate max scroll
+        content_height = self.content_height
+        self.max_scroll = max(0, content_height - scroll_area.height)
+        
+        # Blit the visible part of the content, leaving the left border of the frame uncovered
+        panel.blit(self._cached_content, (scroll_area.x + 3, scroll_area.y),
+                   area=pygame.Rect(3, self.scroll_offset, scroll_area.width - 3, scroll_area.height))
+        
+        # Draw scrollbar if needed
+        if self.max_scroll > 0:
+            scrollbar_rect = pygame.Rect(width - 12, 60, 8, height - 80)
+            pygame.draw.rect(panel, PALE_BROWN, scrollbar_rect)
             
-            # Draw scrollbar if needed
-            if self.max_scroll > 0:
-                scrollbar_rect = pygame.Rect(self.rect.right - 12, self.rect.y + 60, 8, self.rect.height - 80)
-                pygame.draw.rect(screen, PALE_BROWN, scrollbar_rect)
-                
-                # Calculate handle height and position
-                handle_height = max(20, scrollbar_rect.height * (scrollbar_rect.height / content_height))
-                handle_y = scrollbar_rect.y + (self.scroll_offset / self.max_scroll) * (scrollbar_rect.height - handle_height)
-                handle_rect = pygame.Rect(scrollbar_rect.x, handle_y, scrollbar_rect.width, handle_height)
-                pygame.draw.rect(screen, DARK_BROWN, handle_rect)
-
+            # Calculate handle height and position (integer pixels)
+            track_height = scrollbar_rect.height
+            handle_height = max(20, track_height * track_height // content_height)
+            handle_y = scrollbar_rect.y + self.scroll_offset * (track_height - handle_height) // self.max_scroll
+            handle_rect = pygame.Rect(scrollbar_rect.x, handle_y, scrollbar_rect.width, handle_height)
+            pygame.draw.rect(panel, DARK_BROWN, handle_rect)
+        
+        self._panel_surface = panel
+        self._panel_scroll = self.scroll_offset
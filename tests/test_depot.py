@@ -0,0 +1,183 @@
+import datetime
+
+import pytest
+
+from src.models.depot import Depot
+
+
+class FakeGood:
+    """Minimal good with a settable price and an unlimited market."""
+
+    def __init__(self, name, price):
+        self.name = name
+        self.price = price
+
+    def get_price(self):
+        return self.price
+
+    def get_quantity(self):
+        return 10_000
+
+    def buy(self, quantity):
+        pass
+
+    def sell(self, quantity):
+        pass
+
+
+class FakeState:
+    """Game state stand-in providing the date and warnings."""
+
+    def __init__(self):
+        self.date = datetime.datetime(1500, 1, 1, 8)
+        self.warnings = []
+
+    def show_warning(self, message):
+        self.warnings.append(message)
+
+
+@pytest.fixture
+def depot():
+    return Depot(money=10_000, transaction_cost=0, storage_capacity=10_000)
+
+
+@pytest.fixture
+def state():
+    return FakeState()
+
+
+def end_day(depot, state, goods=()):
+    """Run the daily bookkeeping the way Game.run does and advance to the next morning."""
+    depot.update_wealth(list(goods))
+    depot.update_total_stock()
+    depot.update_stock_history()
+    depot.update_income_and_expenditures()
+    depot.update_trade_statistics()
+    state.date += datetime.timedelta(days=1)
+
+
+def test_fresh_depot_counts_nothing_for_any_period(depot):
+    # The history starts with a (0, 0) seed day
+    assert depot.trade_action_history == [(0, 0)]
+    for period_days in (1, 7, 30, 365, None):
+        assert depot.get_trade_action_counts(period_days) == (0, 0)
+        assert depot.trade_start_index(period_days) == 0
+        assert depot.get_period_trade_cycle_stats(period_days)["total_cycles"] == 0
+
+
+def test_trades_of_today_count_for_every_period(depot, state):
+    wood = FakeGood("Wood", 10)
+    depot.buy(wood, 5, state)
+    depot.buy(wood, 1, state)
+    depot.sell(wood, 2, state)
+    for period_days in (1, 7, 30, 365, None):
+        assert depot.get_trade_action_counts(period_days) == (2, 1)
+        assert depot.trade_start_index(period_days) == 0
+
+
+def test_day_rollover_moves_trades_out_of_daily(depot, state):
+    wood = FakeGood("Wood", 10)
+    depot.buy(wood, 5, state)
+    end_day(depot, state, [wood])
+    
+    assert depot.get_trade_action_counts(1) == (0, 0)
+    assert depot.get_trade_action_counts(2) == (1, 0)
+    assert depot.get_trade_action_counts(7) == (1, 0)
+    assert depot.trade_start_index(1) == 1
+    assert depot.trade_start_index(2) == 0
+
+
+def test_counts_per_period_across_several_days(depot, state):
+    wood = FakeGood("Wood", 10)
+    # Day i has i + 1 purchases and i sales
+    for day in range(10):
+        for _ in range(day + 1):
+            depot.buy(wood, 1, state)
+        for _ in range(day):
+            depot.sell(wood, 1, state)
+        end_day(depot, state, [wood])
+    # Today: one purchase
+    depot.buy(wood, 1, state)
+    
+    assert depot.get_trade_action_counts(1) == (1, 0)
+    # Today plus days 9 and 8
+    assert depot.get_trade_action_counts(3) == (1 + 10 + 9, 9 + 8)
+    # Today plus days 9 to 3
+    assert depot.get_trade_action_counts(8) == (1 + sum(range(4, 11)), sum(range(3, 10)))
+    # The trades from trade_start_index on are exactly the counted ones
+    for period_days in (1, 3, 8, 30, None):
+        start = depot.trade_start_index(period_days)
+        purchases = depot.trade_types[start:].count(Depot.TRADE_PURCHASE)
+        sales = depot.trade_types[start:].count(Depot.TRADE_SALE)
+        assert (purchases, sales) == depot.get_trade_action_counts(period_days)
+
+
+def test_periods_longer_than_the_history_include_everything(depot, state):
+    wood = FakeGood("Wood", 10)
+    for _ in range(3):
+        depot.buy(wood, 2, state)
+        depot.sell(wood, 1, state)
+        end_day(depot, state, [wood])
+    depot.buy(wood, 1, state)
+    
+    total = depot.get_trade_action_counts(None)
+    assert total == (4, 3)
+    # 3 closed days plus the seed day and today are shorter than a month or a year
+    assert depot.get_trade_action_counts(30) == total
+    assert depot.get_trade_action_counts(365) == total
+    assert depot.trade_start_index(30) == depot.trade_start_index(365) == 0
+
+
+def test_trade_cycle_stats_per_period(depot, state):
+    wood = FakeGood("Wood", 10)
+    iron = FakeGood("Iron", 50)
+    
+    # Day 1: wood cycle with a profit of 2 per unit
+    depot.buy(wood, 4, state)
+    wood.price = 12
+    depot.sell(wood, 4, state)
+    end_day(depot, state, [wood, iron])
+    
+    # Day 2 (today): iron cycle with a loss of 5 per unit
+    depot.buy(iron, 2, state)
+    iron.price = 45
+    depot.sell(iron, 2, state)
+    
+    daily = depot.get_period_trade_cycle_stats(1)
+    assert daily["total_cycles"] == 1
+    assert daily["successful_cycles"] == 0
+    assert daily["total_profit"] == -10
+    assert daily["best_goods"] == daily["worst_goods"] == [("Iron", -5)]
+    
+    weekly = depot.get_period_trade_cycle_stats(7)
+    assert weekly == depot.get_period_trade_cycle_stats(None)
+    assert weekly["total_cycles"] == 2
+    assert weekly["successful_cycles"] == 1
+    assert weekly["success_rate"] == 50
+    assert weekly["total_profit"] == 8 - 10
+    assert weekly["best_goods"] == [("Wood", 2), ("Iron", -5)]
+    assert weekly["worst_goods"] == [("Iron", -5), ("Wood", 2)]
+
+
+def test_wealth_start_for_each_period(depot, state):
+    wood = FakeGood("Wood", 10)
+    assert depot.wealth_start_for(1) == depot.wealth_start_for(None) == 10_000
+    
+    # Every day the wood in stock gains 1 in value
+    depot.buy(wood, 10, state)
+    for day in range(9):
+        wood.price += 1
+        end_day(depot, state, [wood])
+    # wealth: the start value, then one entry per day
+    assert len(depot.wealth) == 10
+    
+    assert depot.wealth_start_for(1) == depot.wealth[-1]
+    assert depot.wealth_start_for(7) == depot.wealth[-7]
+    # Fewer recorded days than the period: the first recorded wealth
+    assert depot.wealth_start_for(30) == depot.wealth[0] == 10_000
+    assert depot.wealth_start_for(365) == 10_000
+    assert depot.wealth_start_for(None) == 10_000
+    # Any period length works, not only the depot time frames
+    assert depot.wealth_start_for(3) == depot.wealth[-3]
+    assert depot.wealth_start_for(10) == depot.wealth[0]
+    assert depot.wealth_start_for(11) == depot.wealth[0]
@@ -0,0 +1,69 @@
+import datetime
+from types import SimpleNamespace
+
+import pygame
+
+from src.config.constants import TIME_FRAME_DAYS
+from src.game_state import GameState
+from src.models.depot import Depot
+from src.ui.layout_modules.depot_view_detail import DepotViewDetail
+
+
+def _make_panel():
+    """Return a detail panel on a fresh depot, without a display."""
+    depot = Depot(money=1000, transaction_cost=0, storage_capacity=100)
+    game_state = GameState()
+    game_state.game = SimpleNamespace(depot=depot, goods=[], images={})
+    panel = DepotViewDetail(pygame.Rect(0, 0, 800, 600), game_state)
+    return depot, game_state, panel
+
+
+def _trade(depot, game_state, name, quantity, is_purchase):
+    depot.record_trade(SimpleNamespace(name=name), quantity, 10.0, is_purchase, game_state)
+
+
+def _detail_value(panel, statistic, label):
+    """Return the value of a summary line of the given detail statistic."""
+    panel.show_for_statistic(statistic)
+    panel.update_statistics(force=True)
+    for line in panel.cached_stats[statistic]:
+        if line[0] == "kv" and line[2] == label:
+            return line[3]
+    raise AssertionError(f"{label} not in {statistic}")
+
+
+def test_daily_detail_excludes_trades_of_previous_evening():
+    depot, game_state, panel = _make_panel()
+    game_state.date = datetime.datetime(1500, 1, 1, 22)
+    _trade(depot, game_state, "Wood", 2, True)
+    
+    # Day rollover, shortly after midnight
+    depot.update_trade_statistics()
+    game_state.date = datetime.datetime(1500, 1, 2, 1)
+    
+    game_state.depot_time_frame = "Daily"
+    assert depot.get_trade_action_counts(1) == (0, 0)
+    assert _detail_value(panel, "Buy Actions", "Total Units:") == "0"
+    
+    game_state.depot_time_frame = "Weekly"
+    assert depot.get_trade_action_counts(7) == (1, 0)
+    assert _detail_value(panel, "Buy Actions", "Total Units:") == "2"
+
+
+def test_summary_and_detail_totals_match_for_every_time_frame():
+    depot, game_state, panel = _make_panel()
+    # Single-unit trades, so the detail units equal the summary action counts
+    for day in range(10):
+        for _ in range(day % 3 + 1):
+            _trade(depot, game_state, "Wood", 1, True)
+        for _ in range(day % 2):
+            _trade(depot, game_state, "Iron", 1, False)
+        depot.update_trade_statistics()
+    _trade(depot, game_state, "Fish", 1, True)
+    
+    for time_frame, period_days in TIME_FRAME_DAYS.items():
+        game_state.depot_time_frame = time_frame
+        buy_actions, sell_actions = depot.get_trade_action_counts(period_days)
+        assert _detail_value(panel, "Buy Actions", "Total Units:") == f"{buy_actions:,}"
+        assert _detail_value(panel, "Sell Actions", "Total Units:") == f"{sell_actions:,}"
+        assert _detail_value(panel, "Total Actions", "Total Units:") == f"{buy_actions + sell_actions:,}"